@@ -1,20 +1,70 @@
 import os
 import json
 import uuid
+import hashlib
 import asyncio
-import re
 import logging
-from typing import Dict, List, Optional, Any, TypedDict
+import functools
+import threading
+from itertools import chain
+from collections import Counter
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple, TypedDict
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from openai import OpenAI
+import orjson
+from cachetools import TTLCache, cached
 from dotenv import load_dotenv
-from langgraph.graph import StateGraph, START, END
 from jira import JIRA
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 load_dotenv()
 
+# Read once at import; .env values may be wrapped in quotes
+_OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
+if _OPENAI_API_KEY.startswith('"') and _OPENAI_API_KEY.endswith('"'):
+    _OPENAI_API_KEY = _OPENAI_API_KEY[1:-1]
+
+# The SDK retries 408/409/429/5xx and connection errors with jittered exponential backoff up to OPENAI_MAX_RETRIES times
+OPENAI_MAX_RETRIES = 5
+OPENAI_TIMEOUT = 120
+
+@functools.lru_cache(maxsize=1)
+def get_async_openai_client() -> "AsyncOpenAI":
+    """AsyncOpenAI client shared by every agent, so they all use one pooled HTTP/2 connection"""
+    # The CLI runs a single event loop, so one client (and its httpx pool) serves the whole process
+    import httpx
+    from openai import AsyncOpenAI
+    
+    http_client = httpx.AsyncClient(http2=True, limits=httpx.Limits(max_connections=50, max_keepalive_connections=20))
+    return AsyncOpenAI(api_key=_OPENAI_API_KEY, http_client=http_client, max_retries=OPENAI_MAX_RETRIES, timeout=OPENAI_TIMEOUT)
+
+# Completions keyed by the exact request, so repeating the same feedback (or reverting to it) skips the model
+_COMPLETION_CACHE = TTLCache(maxsize=256, ttl=3600)
+
+async def cached_completion(client: "AsyncOpenAI", model: str, system: str, prompt: str,
+                            temperature: float, max_tokens: int) -> str:
+    """Chat completion, answered from memory when the identical request was made within the last hour"""
+    key = hashlib.blake2b(orjson.dumps([model, system, prompt, temperature, max_tokens]), digest_size=16).hexdigest()
+    if key in _COMPLETION_CACHE:
+        return _COMPLETION_CACHE[key]
+    
+    response = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+    content = response.choices[0].message.content.strip()
+    _COMPLETION_CACHE[key] = content
+    return content
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,12 +73,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class GenerationType(Enum):
+class GenerationType(str, Enum):
     EPICS_ONLY = "epics_only"
     STORIES_ONLY = "stories_only"
     BOTH = "both"
 
-class AnalysisPhase(Enum):
+class AnalysisPhase(str, Enum):
     INPUT = "input"
     ANALYZING = "analyzing"
     QUESTIONING = "questioning"
@@ -97,7 +147,26 @@ class JIRAIssue:
     project_key: str
 
 def strip_code_fences(text: str) -> str:
-    return re.sub(r"^```[a-zA-Z]*\n|\n```$", "", text.strip())
+    text = text.strip()
+    # Fences only ever wrap the whole reply, so checking both ends is enough
+    if text.startswith("```"):
+        text = text.partition("\n")[2]
+    return text.removesuffix("```").strip()
+
+def parse_json_response(response: str) -> Dict[str, Any]:
+    """Parse a model reply that should be JSON, with or without code fences"""
+    cleaned_response = strip_code_fences(response)
+    try:
+        return orjson.loads(cleaned_response)
+    except orjson.JSONDecodeError:
+        pass
+    
+    # orjson is strict; the stdlib parser still accepts NaN/Infinity that models sometimes emit for scores
+    try:
+        return json.loads(cleaned_response)
+    except json.JSONDecodeError as e:
+        logger.error("Failed to parse JSON: %s", e)
+        raise ValueError(f"Failed to parse JSON: {e}")
 
 class ProjectAccessManager:
     """Agentic manager for project access control"""
@@ -105,16 +174,16 @@ class ProjectAccessManager:
     def __init__(self, config_file: str = "project_access.json"):
         self.config_file = config_file
         self.allowed_projects = self._load_config()
-        logger.info(f"Project Access Manager initialized with {len(self.allowed_projects)} allowed projects")
+        logger.info("Project Access Manager initialized with %s allowed projects", len(self.allowed_projects))
     
     def _load_config(self) -> List[str]:
         """Load allowed projects from config file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    config = orjson.loads(f.read())
                     projects = config.get('allowed_projects', [])
-                    logger.info(f"Loaded {len(projects)} allowed projects from {self.config_file}")
+                    logger.info("Loaded %s allowed projects from %s", len(projects), self.config_file)
                     return projects
             else:
                 # Create default config
@@ -122,12 +191,12 @@ class ProjectAccessManager:
                     "allowed_projects": ["BU25MVP", "ORI"],
                     "description": "List of JIRA project keys that users can access"
                 }
-                with open(self.config_file, 'w') as f:
-                    json.dump(default_config, f, indent=2)
-                logger.info(f"Created default config file: {self.config_file}")
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
+                logger.info("Created default config file: %s", self.config_file)
                 return default_config['allowed_projects']
         except Exception as e:
-            logger.error(f"Error loading project config: {e}")
+            logger.error("Error loading project config: %s", e)
             return ["BU25MVP", "ORI"]  # Fallback
     
     def is_project_allowed(self, project_key: str) -> bool:
@@ -143,14 +212,14 @@ class ProjectAccessManager:
         if project_key not in self.allowed_projects:
             self.allowed_projects.append(project_key)
             self._save_config()
-            logger.info(f"Added project {project_key} to allowed list")
+            logger.info("Added project %s to allowed list", project_key)
     
     def remove_project(self, project_key: str):
         """Remove project from allowed list"""
         if project_key in self.allowed_projects:
             self.allowed_projects.remove(project_key)
             self._save_config()
-            logger.info(f"Removed project {project_key} from allowed list")
+            logger.info("Removed project %s from allowed list", project_key)
     
     def _save_config(self):
         """Save current config to file"""
@@ -160,11 +229,35 @@ class ProjectAccessManager:
                 "description": "List of JIRA project keys that users can access",
                 "last_updated": datetime.now().isoformat()
             }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            logger.info(f"Saved config to {self.config_file}")
+            with open(self.config_file, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            logger.info("Saved config to %s", self.config_file)
         except Exception as e:
-            logger.error(f"Error saving config: {e}")
+            logger.error("Error saving config: %s", e)
+
+# Only the fields JIRAIssue keeps are requested
+JIRA_ISSUE_FIELDS = "summary,description,issuetype,status"
+JIRA_MAX_ISSUES = 100
+
+def _issue_from_json(issue: Dict[str, Any], project_key: str) -> JIRAIssue:
+    """Build a JIRAIssue from a raw search result"""
+    fields = issue['fields']
+    return JIRAIssue(
+        key=issue['key'],
+        summary=fields.get('summary') or '',
+        description=fields.get('description') or '',
+        issue_type=(fields.get('issuetype') or {}).get('name', ''),
+        status=(fields.get('status') or {}).get('name', ''),
+        project_key=project_key
+    )
+
+# Agent-fetched JIRA data, shared by every node (each builds its own integration) for five minutes
+_PROJECT_CACHE = TTLCache(maxsize=8, ttl=300)
+_ISSUES_CACHE = TTLCache(maxsize=64, ttl=300)
+_TASKS_CACHE = TTLCache(maxsize=64, ttl=300)
+_JIRA_CACHE_LOCK = threading.Lock()
+# Issue fetches still running, so a consumer joins start_node's prefetch instead of fetching again
+_ISSUES_IN_FLIGHT: Dict[str, Future] = {}
 
 class JiraAgenticIntegration:
     """Fully agentic JIRA integration using OpenAI and jira-python"""
@@ -186,41 +279,11 @@ class JiraAgenticIntegration:
                 )
                 logger.info("Agentic JIRA integration configured successfully")
             except Exception as e:
-                logger.error(f"JIRA client failed to initialize: {e}")
+                logger.error("JIRA client failed to initialize: %s", e)
                 self.jira_client = None
         else:
             self.jira_client = None
             logger.warning("JIRA credentials not configured")
-        
-        # Initialize OpenAI client
-        api_key = os.getenv('OPENAI_API_KEY', '')
-        if api_key.startswith('"') and api_key.endswith('"'):
-            api_key = api_key[1:-1]
-        self.openai_client = OpenAI(api_key=api_key)
-    
-    def _execute_jira_agent_task(self, task: str) -> str:
-        """Execute JIRA task using agent-generated code"""
-        try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "developer", "content": """You are a very good python developer who has very good knowledge in jira-python library. Your task is to write executable python code to interact with jira to achieve the task given by the user. The authentication is done and connection is established to jira and instance of jira is created in jira_instance. Return only executable python code with the final result stored in variable 'final_response' which will be used to access the result. Do not add any explanation and return only the executable code as I am directly feeding your response to exec method."""},
-                    {"role": "user", "content": task}
-                ],
-                temperature=0.3
-            )
-            
-            python_code = strip_code_fences(response.choices[0].message.content)
-            
-            # Execute agent-generated code
-            context = {"jira_instance": self.jira_client, "final_response": "No result"}
-            exec(python_code, {}, context)
-            
-            return context.get("final_response", "No result")
-            
-        except Exception as e:
-            logger.error(f"Error executing JIRA agent task: {e}")
-            return f"Error: {str(e)}"
     
     def get_projects_agentic(self) -> List[JIRAProject]:
         """Agentically retrieve and filter projects"""
@@ -235,69 +298,73 @@ class JiraAgenticIntegration:
                 logger.warning("No allowed projects configured")
                 return []
             
-            # Use agent to fetch projects
-            allowed_keys_str = ", ".join(allowed_keys)
-            task = f"Retrieve project details for these project keys: {allowed_keys_str}. Return a list of dicts with 'key', 'name', and 'description' for each project."
+            projects = self._fetch_projects(tuple(allowed_keys))
             
-            result = self._execute_jira_agent_task(task)
-            
-            # Parse result and convert to JIRAProject objects
-            if isinstance(result, str):
-                result = json.loads(result) if result.startswith('[') or result.startswith('{') else []
-            
-            projects = []
-            for proj_data in result:
-                if isinstance(proj_data, dict):
-                    projects.append(JIRAProject(
-                        key=proj_data.get('key', ''),
-                        name=proj_data.get('name', ''),
-                        description=proj_data.get('description', '')
-                    ))
-            
-            logger.info(f"Successfully retrieved {len(projects)} accessible projects")
+            logger.info("Successfully retrieved %s accessible projects", len(projects))
             return projects
             
         except Exception as e:
-            logger.error(f"Error in agentic project retrieval: {e}")
+            logger.error("Error in agentic project retrieval: %s", e)
             return []
     
+    @cached(_PROJECT_CACHE, key=lambda self, allowed_keys: allowed_keys, lock=_JIRA_CACHE_LOCK)
+    def _fetch_projects(self, allowed_keys: tuple) -> List[JIRAProject]:
+        """Fetch the allowed projects straight from JIRA; cached per allowed-key set"""
+        return [
+            JIRAProject(
+                key=project.key,
+                name=project.name,
+                description=getattr(project, 'description', '') or ''
+            )
+            for project in self.jira_client.projects()
+            if project.key in allowed_keys
+        ]
+    
     def get_issues_agentic(self, project_key: str) -> List[JIRAIssue]:
         """Agentically retrieve issues"""
         if not self.jira_client:
             return []
         
         if not self.access_manager.is_project_allowed(project_key):
-            logger.warning(f"Access denied to project {project_key}")
+            logger.warning("Access denied to project %s", project_key)
             return []
         
         try:
-            task = f"For project '{project_key}', retrieve all issues (max 100) with fields: key, summary, description, issue type, status. Return as list of dicts."
-            
-            result = self._execute_jira_agent_task(task)
-            
-            # Parse result
-            if isinstance(result, str):
-                result = json.loads(result) if result.startswith('[') else []
-            
-            jira_issues = []
-            for issue_data in result:
-                if isinstance(issue_data, dict):
-                    jira_issues.append(JIRAIssue(
-                        key=issue_data.get('key', ''),
-                        summary=issue_data.get('summary', ''),
-                        description=issue_data.get('description', ''),
-                        issue_type=issue_data.get('issue_type', ''),
-                        status=issue_data.get('status', ''),
-                        project_key=project_key
-                    ))
-            
-            logger.info(f"Retrieved {len(jira_issues)} issues from {project_key}")
+            jira_issues = list(self._fetch_issues_once(project_key))
+            logger.info("Retrieved %s issues from %s", len(jira_issues), project_key)
             return jira_issues
             
         except Exception as e:
-            logger.error(f"Error getting issues: {e}")
+            logger.error("Error getting issues: %s", e)
             return []
     
+    def _fetch_issues_once(self, project_key: str) -> List[JIRAIssue]:
+        """Fetch a project's issues, waiting on a fetch of the same project already in flight"""
+        with _JIRA_CACHE_LOCK:
+            future = _ISSUES_IN_FLIGHT.get(project_key)
+            owner = future is None
+            if owner:
+                future = _ISSUES_IN_FLIGHT[project_key] = Future()
+        if not owner:
+            return future.result()
+        
+        try:
+            future.set_result(self._fetch_issues(project_key))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with _JIRA_CACHE_LOCK:
+                del _ISSUES_IN_FLIGHT[project_key]
+        return future.result()
+    
+    @cached(_ISSUES_CACHE, key=lambda self, project_key: project_key, lock=_JIRA_CACHE_LOCK)
+    def _fetch_issues(self, project_key: str) -> List[JIRAIssue]:
+        """Fetch a project's issues in one search; cached per project key"""
+        # A fixed query needs no generated code, and json_result skips building a Resource tree per issue
+        jql = f'project = "{project_key}" ORDER BY created ASC'
+        result = self.jira_client.search_issues(jql, maxResults=JIRA_MAX_ISSUES, fields=JIRA_ISSUE_FIELDS, json_result=True)
+        return [_issue_from_json(issue, project_key) for issue in result['issues']]
+    
     def get_all_tasks_agentic(self, project_key: str) -> str:
         """Get comprehensive task list using agent"""
         if not self.jira_client:
@@ -307,36 +374,45 @@ class JiraAgenticIntegration:
             return f"Access denied to project {project_key}"
         
         try:
-            task = f"""For project '{project_key}', retrieve all issues and format them comprehensively:
-- Issue count by type
-- Each issue with: Key, Title, Type, Status, Description (first 150 chars)
-- Grouped by issue type (Epic, Story, Task, Bug, etc.)
-Return formatted string output."""
-            
-            result = self._execute_jira_agent_task(task)
-            return result
+            return self._fetch_tasks(project_key)
                 
         except Exception as e:
-            logger.error(f"Error in agentic task retrieval: {e}")
+            logger.error("Error in agentic task retrieval: %s", e)
             return f"Error: {str(e)}"
     
+    @cached(_TASKS_CACHE, key=lambda self, project_key: project_key, lock=_JIRA_CACHE_LOCK)
+    def _fetch_tasks(self, project_key: str) -> str:
+        """Format a project's task list, grouped by issue type; cached per project key"""
+        # Reuses the pruned-field search (and any fetch already in flight) rather than generated code
+        issues = self._fetch_issues_once(project_key)
+        by_type: Dict[str, List[JIRAIssue]] = {}
+        for issue in issues:
+            by_type.setdefault(issue.issue_type or "Other", []).append(issue)
+        
+        counts = ", ".join(f"{issue_type}: {len(group)}" for issue_type, group in by_type.items())
+        lines = [f"Project {project_key}: {len(issues)} issues", f"Issue count by type: {counts or 'none'}"]
+        for issue_type, group in by_type.items():
+            lines.append(f"\n{issue_type}")
+            lines.extend(
+                f"  {issue.key} | {issue.summary} | Type: {issue.issue_type} | Status: {issue.status}\n"
+                f"    {issue.description[:150]}"
+                for issue in group
+            )
+        return "\n".join(lines)
+    
     def generate_context_guidance(self, issues: List[JIRAIssue], hlr: str) -> str:
         """Generate agentic guidance based on JIRA context"""
         if not issues:
             return ""
         
-        issue_types = {}
-        statuses = {}
-        
-        for issue in issues:
-            issue_types[issue.issue_type] = issue_types.get(issue.issue_type, 0) + 1
-            statuses[issue.status] = statuses.get(issue.status, 0) + 1
+        issue_types = Counter(issue.issue_type for issue in issues)
+        statuses = Counter(issue.status for issue in issues)
         
         guidance = f"""
 JIRA Project Context Analysis:
 - Total Issues: {len(issues)}
-- Issue Types: {dict(sorted(issue_types.items(), key=lambda x: x[1], reverse=True))}
-- Status Distribution: {dict(sorted(statuses.items(), key=lambda x: x[1], reverse=True))}
+- Issue Types: {dict(issue_types.most_common())}
+- Status Distribution: {dict(statuses.most_common())}
 
 Contextual Recommendations for HLR "{hlr}":
 1. Consider existing issue patterns
@@ -348,14 +424,10 @@ Contextual Recommendations for HLR "{hlr}":
 
 class RequirementAnalysisAgent:
     def __init__(self):
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
+        if not _OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY not found")
         
-        if api_key.startswith('"') and api_key.endswith('"'):
-            api_key = api_key[1:-1]
-        
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_async_openai_client()
         self.model = "gpt-4"
         self.temperature = 0.3
         
@@ -414,10 +486,10 @@ JSON only:
         try:
             response = await self._call_openai(analysis_prompt)
             result = self._parse_json_response(response)
-            logger.info(f"Analysis completed: {result.get('slicing_type')}")
+            logger.info("Analysis completed: %s", result.get('slicing_type'))
             return result
         except Exception as e:
-            logger.error(f"Error analyzing requirement: {e}")
+            logger.error("Error analyzing requirement: %s", e)
             return {
                 "slicing_type": "functional",
                 "recommended_persona": "Business Analyst", 
@@ -475,11 +547,11 @@ JSON only:
                 )
                 questions.append(question)
             
-            logger.info(f"Generated {len(questions)} questions")
+            logger.info("Generated %s questions", len(questions))
             return questions
             
         except Exception as e:
-            logger.error(f"Error generating questions: {e}")
+            logger.error("Error generating questions: %s", e)
             return []
     
     async def validate_response(self, hlr: str, question: Question, user_response: str) -> ValidationResult:
@@ -516,11 +588,11 @@ JSON only:
                 confidence=validation_data['confidence']
             )
             
-            logger.info(f"Validation completed: {'valid' if result.is_valid else 'invalid'}")
+            logger.info("Validation completed: %s", 'valid' if result.is_valid else 'invalid')
             return result
             
         except Exception as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             return ValidationResult(
                 is_valid=True,
                 overall_score=0.7,
@@ -531,7 +603,7 @@ JSON only:
     
     async def _call_openai(self, prompt: str) -> str:
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert requirements analyst. Respond with valid JSON only."},
@@ -542,19 +614,14 @@ JSON only:
             )
             return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
+            logger.error("OpenAI API error: %s", e)
             raise
     
     def _parse_json_response(self, response: str) -> Dict[str, Any]:
-        try:
-            cleaned_response = re.sub(r'```json\n?|\n?```', '', response.strip())
-            return json.loads(cleaned_response)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {e}")
-            raise ValueError(f"Failed to parse JSON: {e}")
+        return parse_json_response(response)
 
 class EpicGeneratorAgent:
-    def __init__(self, openai_client: OpenAI):
+    def __init__(self, openai_client: "AsyncOpenAI"):
         self.client = openai_client
         self.model = "gpt-4"
         self.temperature = 0.3
@@ -597,10 +664,10 @@ JSON only:
             response = await self._call_openai(epic_prompt)
             epic_data = self._parse_json_response(response)
             epics = epic_data.get('epics', [])
-            logger.info(f"Generated {len(epics)} epics")
+            logger.info("Generated %s epics", len(epics))
             return epics
         except Exception as e:
-            logger.error(f"Error generating epics: {e}")
+            logger.error("Error generating epics: %s", e)
             return []
     
     def _build_qa_context(self, qa_responses: Dict[str, str]) -> str:
@@ -616,30 +683,23 @@ JSON only:
     
     async def _call_openai(self, prompt: str) -> str:
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert Epic writer. Respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=3000
+            return await cached_completion(
+                self.client,
+                self.model,
+                "You are an expert Epic writer. Respond with valid JSON only.",
+                prompt,
+                self.temperature,
+                3000
             )
-            return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
+            logger.error("OpenAI API error: %s", e)
             raise
     
     def _parse_json_response(self, response: str) -> Dict[str, Any]:
-        try:
-            cleaned_response = re.sub(r'```json\n?|\n?```', '', response.strip())
-            return json.loads(cleaned_response)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {e}")
-            raise ValueError(f"Failed to parse JSON: {e}")
+        return parse_json_response(response)
 
 class UserStoryGeneratorAgent:
-    def __init__(self, openai_client: OpenAI):
+    def __init__(self, openai_client: "AsyncOpenAI"):
         self.client = openai_client
         self.model = "gpt-4"
         self.temperature = 0.3
@@ -692,10 +752,10 @@ JSON only:
             response = await self._call_openai(story_prompt)
             story_data = self._parse_json_response(response)
             stories = story_data.get('user_stories', [])
-            logger.info(f"Generated {len(stories)} user stories")
+            logger.info("Generated %s user stories", len(stories))
             return stories
         except Exception as e:
-            logger.error(f"Error generating user stories: {e}")
+            logger.error("Error generating user stories: %s", e)
             return []
     
     def _build_qa_context(self, qa_responses: Dict[str, str]) -> str:
@@ -721,27 +781,20 @@ JSON only:
     
     async def _call_openai(self, prompt: str) -> str:
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert User Story writer. Respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=4000
+            return await cached_completion(
+                self.client,
+                self.model,
+                "You are an expert User Story writer. Respond with valid JSON only.",
+                prompt,
+                self.temperature,
+                4000
             )
-            return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
+            logger.error("OpenAI API error: %s", e)
             raise
     
     def _parse_json_response(self, response: str) -> Dict[str, Any]:
-        try:
-            cleaned_response = re.sub(r'```json\n?|\n?```', '', response.strip())
-            return json.loads(cleaned_response)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {e}")
-            raise ValueError(f"Failed to parse JSON: {e}")
+        return parse_json_response(response)
 
 # Interactive functions
 def select_project(projects: List[JIRAProject]) -> Optional[str]:
@@ -766,20 +819,22 @@ def get_workflow_choice() -> str:
         if choice in ["1", "2"]:
             return "existing" if choice == "1" else "new"
 
-def display_all_issues_agentic(jira_agent: JiraAgenticIntegration, project_key: str) -> str:
-    """Agentic display of all issues"""
+async def display_all_issues_agentic(jira_agent: JiraAgenticIntegration, project_key: str) -> Tuple[str, List[JIRAIssue]]:
+    """Agentic display of all issues; also returns the fetched issues for reuse"""
     print(f"\nRetrieving tasks from project {project_key}...")
     
-    tasks_display = jira_agent.get_all_tasks_agentic(project_key)
+    # Each agent task is a blocking model call plus JIRA requests; run both at once off the event loop
+    tasks_display, issues = await asyncio.gather(
+        asyncio.to_thread(jira_agent.get_all_tasks_agentic, project_key),
+        asyncio.to_thread(jira_agent.get_issues_agentic, project_key)
+    )
     print(tasks_display)
     
-    issues = jira_agent.get_issues_agentic(project_key)
-    
-    issues_detail = []
-    for issue in issues:
-        issues_detail.append(f"Issue: {issue.key} - {issue.summary}\nType: {issue.issue_type}\nStatus: {issue.status}\nDescription: {issue.description}")
-    
-    return "\n\n".join(issues_detail)
+    issues_detail = "\n\n".join(
+        f"Issue: {issue.key} - {issue.summary}\nType: {issue.issue_type}\nStatus: {issue.status}\nDescription: {issue.description}"
+        for issue in issues
+    )
+    return issues_detail, issues
 
 def get_persona_with_suggestion(recommended_persona: str) -> str:
     """Get persona with AI suggestion and user confirmation"""
@@ -840,7 +895,7 @@ async def start_node(state: WorkflowState) -> WorkflowState:
     # Select project first
     print("\nAvailable Projects:")
     print("-" * 40)
-    projects = jira_agent.get_projects_agentic()
+    projects = await asyncio.to_thread(jira_agent.get_projects_agentic)
     
     if not projects:
         print("No accessible JIRA projects found")
@@ -859,6 +914,11 @@ async def start_node(state: WorkflowState) -> WorkflowState:
     
     state["selected_project"] = selected_project_key
     
+    # Speculatively fetch the project's issues into the cache while the user picks a workflow.
+    # run_in_executor submits immediately, so the fetch proceeds even while input() blocks the loop;
+    # a later get_issues_agentic joins it while in flight and sees any error it raised.
+    asyncio.get_running_loop().run_in_executor(None, jira_agent.get_issues_agentic, selected_project_key)
+    
     # Now ask workflow choice
     state["workflow_type"] = get_workflow_choice()
     
@@ -871,10 +931,8 @@ async def jira_integration_node(state: WorkflowState) -> WorkflowState:
     jira_agent = JiraAgenticIntegration()
     
     # Display all issues
-    issues_detail = display_all_issues_agentic(jira_agent, state["selected_project"])
+    issues_detail, issues = await display_all_issues_agentic(jira_agent, state["selected_project"])
     state["issues_detail"] = issues_detail
-    
-    issues = jira_agent.get_issues_agentic(state["selected_project"])
     state["selected_issues"] = [issue.key for issue in issues]
     
     # Get HLR after displaying issues
@@ -976,41 +1034,51 @@ async def setup_generation_node(state: WorkflowState) -> WorkflowState:
     state["generation_type"] = get_generation_type()
     return state
 
-async def generation_node(state: WorkflowState) -> WorkflowState:
-    state["current_step"] = "generation"
-    state["phase"] = AnalysisPhase.GENERATING
-    
-    # Prepare context
-    context = f"Persona: {state.get('persona', 'Business Analyst')}\n"
-    context += f"Slicing Type: {state.get('slicing_type', 'functional')}\n"
-    context += f"Domain: {state.get('requirement_analysis', {}).get('domain', 'general')}\n"
-    
-    if state.get("issues_detail"):
-        context += f"\nJIRA Issues Context:\n{state['issues_detail']}"
-    
-    # Initialize OpenAI client
-    api_key = os.getenv('OPENAI_API_KEY')
-    if api_key.startswith('"') and api_key.endswith('"'):
-        api_key = api_key[1:-1]
-    openai_client = OpenAI(api_key=api_key)
-    
-    epic_agent = EpicGeneratorAgent(openai_client)
-    story_agent = UserStoryGeneratorAgent(openai_client)
+@functools.lru_cache(maxsize=1)
+def _get_agents():
+    """Epic and story generators sharing one OpenAI client (and its connection pool) for the whole process"""
+    openai_client = get_async_openai_client()
+    return EpicGeneratorAgent(openai_client), UserStoryGeneratorAgent(openai_client)
+
+async def generate_content(state: WorkflowState, context: str):
+    """Generate the requested epics and stories, issuing both LLM calls concurrently"""
+    epic_agent, story_agent = _get_agents()
     
-    # Generate content based on type
+    tasks = {}
     if state["generation_type"] in [GenerationType.EPICS_ONLY, GenerationType.BOTH]:
-        epics = await epic_agent.generate_epics(state["hlr"], context, state["responses"])
-        state["epics"] = epics
+        tasks["epics"] = epic_agent.generate_epics(state["hlr"], context, state["responses"])
     
     if state["generation_type"] in [GenerationType.STORIES_ONLY, GenerationType.BOTH]:
-        stories = await story_agent.generate_user_stories(
+        # Stories reference the epics already in state (the previous iteration when regenerating)
+        tasks["user_stories"] = story_agent.generate_user_stories(
             state["hlr"], 
             context, 
             state["responses"], 
             state.get("epics", [])
         )
-        state["user_stories"] = stories
     
+    results = await asyncio.gather(*tasks.values())
+    state.update(zip(tasks, results))
+
+async def generation_node(state: WorkflowState) -> WorkflowState:
+    state["current_step"] = "generation"
+    state["phase"] = AnalysisPhase.GENERATING
+    
+    analysis = state.get('requirement_analysis') or {}
+    
+    # Prepare context
+    context_parts = [
+        f"Persona: {state.get('persona', 'Business Analyst')}\n",
+        f"Slicing Type: {state.get('slicing_type', 'functional')}\n",
+        f"Domain: {analysis.get('domain', 'general')}\n",
+    ]
+    
+    if state.get("issues_detail"):
+        context_parts.append(f"\nJIRA Issues Context:\n{state['issues_detail']}")
+    
+    context = "".join(context_parts)
+    
+    await generate_content(state, context)
     return state
 
 async def feedback_node(state: WorkflowState) -> WorkflowState:
@@ -1039,14 +1107,25 @@ async def feedback_node(state: WorkflowState) -> WorkflowState:
             print(f"   Priority: {story.get('priority', 'Not set')}")
             print(f"   Story Points: {story.get('story_points', 'Not estimated')}")
     
-    # Feedback loop (max 3 iterations)
+    # Regeneration context shared by every feedback iteration
+    context_parts = [
+        f"Persona: {state.get('persona', 'Business Analyst')}\n",
+        f"Slicing Type: {state.get('slicing_type', 'functional')}\n",
+    ]
+    
+    if state.get("issues_detail"):
+        context_parts.append(f"\nJIRA Context:\n{state['issues_detail']}")
+    
+    base_context = "".join(context_parts)
+    
+    # Feedback loop (max 3 iterations); prompts are read in a thread so the event loop is never blocked
     while state["feedback_count"] < 3:
-        satisfied = input("\nSatisfied with content? (yes/no): ").strip().lower()
+        satisfied = (await asyncio.to_thread(input, "\nSatisfied with content? (yes/no): ")).strip().lower()
         
         if satisfied in ['yes', 'y']:
             break
         
-        feedback = input("Provide feedback for improvements: ").strip()
+        feedback = (await asyncio.to_thread(input, "Provide feedback for improvements: ")).strip()
         if not feedback:
             break
         
@@ -1055,34 +1134,9 @@ async def feedback_node(state: WorkflowState) -> WorkflowState:
             state["feedback_count"] += 1
             
             # Regenerate with feedback
-            base_context = f"Persona: {state.get('persona', 'Business Analyst')}\n"
-            base_context += f"Slicing Type: {state.get('slicing_type', 'functional')}\n"
-            
-            if state.get("issues_detail"):
-                base_context += f"\nJIRA Context:\n{state['issues_detail']}"
-            
             feedback_context = f"{base_context}\n\nUser Feedback: {feedback}\nIteration: {state['feedback_count']}"
             
-            api_key = os.getenv('OPENAI_API_KEY')
-            if api_key.startswith('"') and api_key.endswith('"'):
-                api_key = api_key[1:-1]
-            openai_client = OpenAI(api_key=api_key)
-            
-            epic_agent = EpicGeneratorAgent(openai_client)
-            story_agent = UserStoryGeneratorAgent(openai_client)
-            
-            if state["generation_type"] in [GenerationType.EPICS_ONLY, GenerationType.BOTH]:
-                epics = await epic_agent.generate_epics(state["hlr"], feedback_context, state["responses"])
-                state["epics"] = epics
-            
-            if state["generation_type"] in [GenerationType.STORIES_ONLY, GenerationType.BOTH]:
-                stories = await story_agent.generate_user_stories(
-                    state["hlr"], 
-                    feedback_context, 
-                    state["responses"], 
-                    state.get("epics", [])
-                )
-                state["user_stories"] = stories
+            await generate_content(state, feedback_context)
             
             # Show updated content
             print("\n" + "="*80)
@@ -1101,55 +1155,60 @@ async def feedback_node(state: WorkflowState) -> WorkflowState:
         else:
             break
     
+    finalize_state(state)
     return state
 
-async def final_validation_node(state: WorkflowState) -> WorkflowState:
+def finalize_state(state: WorkflowState):
+    """Final validation, run at the end of feedback_node rather than as its own graph hop"""
     state["current_step"] = "final_validation"
     state["phase"] = AnalysisPhase.COMPLETE
     
-    if not state.get("epics") and not state.get("user_stories"):
+    if not (state.get("epics") or state.get("user_stories")):
         state["errors"].append("No content generated")
-    
-    return state
 
 # Routing functions
 def should_use_jira(state: WorkflowState) -> str:
     """Conditional edge based on workflow type"""
     return "jira_integration" if state.get("workflow_type") == "existing" else "new_requirement"
 
-# Create workflow
-workflow = StateGraph(WorkflowState)
-
-# Add nodes
-workflow.add_node("start", start_node)
-workflow.add_node("jira_integration", jira_integration_node)
-workflow.add_node("new_requirement", new_requirement_node)
-workflow.add_node("requirement_analysis", requirement_analysis_node)
-workflow.add_node("setup_generation", setup_generation_node)
-workflow.add_node("generation", generation_node)
-workflow.add_node("feedback", feedback_node)
-workflow.add_node("final_validation", final_validation_node)
-
-# Add edges with conditional routing
-workflow.set_entry_point("start")
-workflow.add_conditional_edges("start", should_use_jira)
-workflow.add_edge("jira_integration", "requirement_analysis")
-workflow.add_edge("new_requirement", "requirement_analysis")
-workflow.add_edge("requirement_analysis", "setup_generation")
-workflow.add_edge("setup_generation", "generation")
-workflow.add_edge("generation", "feedback")
-workflow.add_edge("feedback", "final_validation")
-workflow.add_edge("final_validation", END)
-
-# Compile workflow
-app = workflow.compile()
+@functools.cache
+def _get_app():
+    """Build and compile the workflow graph the first time it is needed"""
+    from langgraph.graph import StateGraph, END
+    
+    workflow = StateGraph(WorkflowState)
+    
+    # Add nodes
+    workflow.add_node("start", start_node)
+    workflow.add_node("jira_integration", jira_integration_node)
+    workflow.add_node("new_requirement", new_requirement_node)
+    workflow.add_node("requirement_analysis", requirement_analysis_node)
+    workflow.add_node("setup_generation", setup_generation_node)
+    workflow.add_node("generation", generation_node)
+    workflow.add_node("feedback", feedback_node)
+    
+    # Add edges with conditional routing
+    workflow.set_entry_point("start")
+    workflow.add_conditional_edges("start", should_use_jira)
+    workflow.add_edge("jira_integration", "requirement_analysis")
+    workflow.add_edge("new_requirement", "requirement_analysis")
+    workflow.add_edge("requirement_analysis", "setup_generation")
+    workflow.add_edge("setup_generation", "generation")
+    workflow.add_edge("generation", "feedback")
+    workflow.add_edge("feedback", END)
+    
+    # A one-shot CLI run needs no checkpointer, so LangGraph does not snapshot state after every node
+    return workflow.compile(checkpointer=None, debug=False)
+
+# One epic or story in the results summary
+_RESULT_ITEM_TEMPLATE = "\n{index}. {title}\n   Priority: {priority}\n   Story Points: {points}"
 
 def display_results(state: WorkflowState):
-    print("\n" + "="*60)
-    print("WORKFLOW RESULTS")
-    print("="*60)
-    
-    session_info = f"""
+    lines = [
+        "\n" + "="*60,
+        "WORKFLOW RESULTS",
+        "="*60,
+        f"""
 Session ID: {state['session_id']}
 Workflow Type: {state['workflow_type']}
 Persona: {state.get('persona', 'Not set')}
@@ -1158,40 +1217,74 @@ Generation Type: {state.get('generation_type', {}).value if state.get('generatio
 Overall Confidence: {state.get('overall_confidence', 0.0):.2f}
 Feedback Iterations: {state.get('feedback_count', 0)}
 """
-    print(session_info)
+    ]
     
     if state.get('selected_project'):
-        print(f"JIRA Project: {state['selected_project']}")
-        print(f"Issues Analyzed: {len(state.get('selected_issues', []))}")
+        lines.append(f"JIRA Project: {state['selected_project']}")
+        lines.append(f"Issues Analyzed: {len(state.get('selected_issues', []))}")
     
-    print(f"\nHigh Level Requirement:")
-    print("-" * 30)
-    print(state.get('hlr', 'Not provided'))
+    lines += [f"\nHigh Level Requirement:", "-" * 30, state.get('hlr', 'Not provided')]
     
     if state.get('epics'):
-        print(f"\nGenerated Epics ({len(state['epics'])}):")
-        print("-" * 30)
-        for i, epic in enumerate(state['epics'], 1):
-            print(f"\n{i}. {epic.get('title', 'Untitled')}")
-            print(f"   Priority: {epic.get('priority', 'Not set')}")
-            print(f"   Story Points: {epic.get('estimated_story_points', 'Not estimated')}")
+        lines += [f"\nGenerated Epics ({len(state['epics'])}):", "-" * 30]
+        lines.extend(
+            _RESULT_ITEM_TEMPLATE.format(
+                index=i,
+                title=item.get('title', 'Untitled'),
+                priority=item.get('priority', 'Not set'),
+                points=item.get('estimated_story_points', 'Not estimated')
+            )
+            for i, item in enumerate(state['epics'], 1)
+        )
     
     if state.get('user_stories'):
-        print(f"\nGenerated User Stories ({len(state['user_stories'])}):")
-        print("-" * 30)
-        for i, story in enumerate(state['user_stories'], 1):
-            print(f"\n{i}. {story.get('title', 'Untitled')}")
-            print(f"   Priority: {story.get('priority', 'Not set')}")
-            print(f"   Story Points: {story.get('story_points', 'Not estimated')}")
+        lines += [f"\nGenerated User Stories ({len(state['user_stories'])}):", "-" * 30]
+        lines.extend(
+            _RESULT_ITEM_TEMPLATE.format(
+                index=i,
+                title=item.get('title', 'Untitled'),
+                priority=item.get('priority', 'Not set'),
+                points=item.get('story_points', 'Not estimated')
+            )
+            for i, item in enumerate(state['user_stories'], 1)
+        )
     
     if state.get('errors'):
-        print("\nErrors:")
-        print("-" * 30)
-        for error in state['errors']:
-            print(f"- {error}")
+        lines += ["\nErrors:", "-" * 30]
+        lines.extend(f"- {error}" for error in state['errors'])
+    
+    # One write instead of a print per line
+    print("\n".join(lines))
+
+# Output fields of generated items and the defaults used when the model omits one
+_EPIC_OUTPUT_FIELDS = {
+    "title": '',
+    "description": '',
+    "business_value": '',
+    "acceptance_criteria": [],
+    "priority": '',
+    "estimated_story_points": 0,
+    "dependencies": [],
+    "assumptions": [],
+    "risks": []
+}
 
-def create_clean_output(state: WorkflowState) -> Dict[str, Any]:
-    """Create clean output without validation scores"""
+_STORY_OUTPUT_FIELDS = {
+    "title": '',
+    "description": '',
+    "user_persona": '',
+    "acceptance_criteria": [],
+    "definition_of_done": [],
+    "story_points": 0,
+    "priority": '',
+    "labels": [],
+    "dependencies": [],
+    "epic_reference": None
+}
+
+def create_clean_output(state: WorkflowState, include_content: bool = True) -> Dict[str, Any]:
+    """Create clean output without validation scores; generated_content is left empty unless include_content"""
+    analysis = state.get('requirement_analysis') or {}
     
     output = {
         "session_metadata": {
@@ -1207,10 +1300,10 @@ def create_clean_output(state: WorkflowState) -> Dict[str, Any]:
         "requirement": {
             "hlr": state.get('hlr', ''),
             "analysis": {
-                "domain": state.get('requirement_analysis', {}).get('domain', ''),
-                "complexity": state.get('requirement_analysis', {}).get('complexity', ''),
-                "user_types": state.get('requirement_analysis', {}).get('user_types', []),
-                "main_features": state.get('requirement_analysis', {}).get('main_features', [])
+                "domain": analysis.get('domain', ''),
+                "complexity": analysis.get('complexity', ''),
+                "user_types": analysis.get('user_types', []),
+                "main_features": analysis.get('main_features', [])
             }
         }
     }
@@ -1233,52 +1326,35 @@ def create_clean_output(state: WorkflowState) -> Dict[str, Any]:
         
         output["qa_session"] = {
             "total_questions": len(state['questions']),
-            "answered_questions": len([q for q in state['questions'] if q.answered and not q.skipped]),
+            "answered_questions": len(qa_summary),
             "responses": qa_summary
         }
     
+    epics = state.get('epics') or []
+    stories = state.get('user_stories') or []
     generated_content = {}
     
-    if state.get('epics'):
-        generated_content["epics"] = []
-        for epic in state['epics']:
-            clean_epic = {
-                "title": epic.get('title', ''),
-                "description": epic.get('description', ''),
-                "business_value": epic.get('business_value', ''),
-                "acceptance_criteria": epic.get('acceptance_criteria', []),
-                "priority": epic.get('priority', ''),
-                "estimated_story_points": epic.get('estimated_story_points', 0),
-                "dependencies": epic.get('dependencies', []),
-                "assumptions": epic.get('assumptions', []),
-                "risks": epic.get('risks', [])
-            }
-            generated_content["epics"].append(clean_epic)
+    if epics and include_content:
+        generated_content["epics"] = [
+            {field: epic.get(field, default) for field, default in _EPIC_OUTPUT_FIELDS.items()}
+            for epic in epics
+        ]
     
-    if state.get('user_stories'):
-        generated_content["user_stories"] = []
-        for story in state['user_stories']:
-            clean_story = {
-                "title": story.get('title', ''),
-                "description": story.get('description', ''),
-                "user_persona": story.get('user_persona', ''),
-                "acceptance_criteria": story.get('acceptance_criteria', []),
-                "definition_of_done": story.get('definition_of_done', []),
-                "story_points": story.get('story_points', 0),
-                "priority": story.get('priority', ''),
-                "labels": story.get('labels', []),
-                "dependencies": story.get('dependencies', []),
-                "epic_reference": story.get('epic_reference', None)
-            }
-            generated_content["user_stories"].append(clean_story)
+    if stories and include_content:
+        generated_content["user_stories"] = [
+            {field: story.get(field, default) for field, default in _STORY_OUTPUT_FIELDS.items()}
+            for story in stories
+        ]
     
     output["generated_content"] = generated_content
     
     output["statistics"] = {
-        "total_epics": len(state.get('epics', [])),
-        "total_user_stories": len(state.get('user_stories', [])),
-        "total_story_points": sum(epic.get('estimated_story_points', 0) for epic in state.get('epics', [])) + 
-                            sum(story.get('story_points', 0) for story in state.get('user_stories', [])),
+        "total_epics": len(epics),
+        "total_user_stories": len(stories),
+        "total_story_points": sum(chain(
+            (epic.get('estimated_story_points', 0) for epic in epics),
+            (story.get('story_points', 0) for story in stories)
+        )),
         "errors_count": len(state.get('errors', []))
     }
     
@@ -1290,6 +1366,44 @@ def create_clean_output(state: WorkflowState) -> Dict[str, Any]:
     
     return output
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+def _indented_json(value: Any, depth: int) -> bytes:
+    """Indented JSON for a value nested `depth` levels deep; raw newlines only occur between tokens"""
+    return orjson.dumps(value, option=_JSON_OPTIONS).replace(b"\n", b"\n" + b"  " * depth)
+
+def save_clean_output(state: WorkflowState) -> str:
+    """Write the clean output to disk, serialising one generated item at a time instead of the whole tree"""
+    output = create_clean_output(state, include_content=False)
+    sections = [
+        (key, items, fields)
+        for key, items, fields in (
+            ("epics", state.get('epics') or [], _EPIC_OUTPUT_FIELDS),
+            ("user_stories", state.get('user_stories') or [], _STORY_OUTPUT_FIELDS),
+        )
+        if items
+    ]
+    
+    filename = f"jira_results_{state['session_id']}.json"
+    with open(filename, 'wb') as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(output.items()):
+            f.write((b"," if i else b"") + b"\n  " + orjson.dumps(key) + b": ")
+            if key != "generated_content" or not sections:
+                f.write(_indented_json(value, 1))
+                continue
+            
+            f.write(b"{")
+            for j, (section, items, fields) in enumerate(sections):
+                f.write((b"," if j else b"") + b"\n    " + orjson.dumps(section) + b": [")
+                for k, item in enumerate(items):
+                    clean = {field: item.get(field, default) for field, default in fields.items()}
+                    f.write((b"," if k else b"") + b"\n      " + _indented_json(clean, 3))
+                f.write(b"\n    ]")
+            f.write(b"\n  }")
+        f.write(b"\n}")
+    return filename
+
 async def run_workflow():
     initial_state = {
         "session_id": "",
@@ -1317,22 +1431,18 @@ async def run_workflow():
     }
     
     try:
-        final_state = await app.ainvoke(initial_state)
+        final_state = await _get_app().ainvoke(initial_state)
         display_results(final_state)
         
-        clean_output = create_clean_output(final_state)
-        
         save_option = input("\nSave results to file? (y/n): ").strip().lower()
         if save_option == 'y':
-            filename = f"jira_results_{final_state['session_id']}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(clean_output, f, indent=2, ensure_ascii=False)
+            filename = save_clean_output(final_state)
             print(f"Results saved to {filename}")
         
         return final_state
         
     except Exception as e:
-        logger.error(f"Workflow error: {e}")
+        logger.error("Workflow error: %s", e)
         print(f"Workflow error: {e}")
         raise
 
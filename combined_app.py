@@ -11,7 +11,9 @@ load_dotenv()
 
 # Move imports to the top to avoid redundant imports
 from main import GenerationType, AnalysisPhase
+@st.cache_data
 def get_base64_image(image_path):
+    """Base64-encode an image once per process instead of on every rerun"""
     with open(image_path, "rb") as f:
         data = f.read()
         return base64.b64encode(data).decode()
@@ -419,10 +421,12 @@ def chat_interface():
     @st.cache_resource
     def initialize_agents():
         """Initialize agents once and cache them"""
-        from main import JiraAgenticIntegration, RequirementAnalysisAgent
+        from main import JiraAgenticIntegration, RequirementAnalysisAgent, EpicGeneratorAgent, UserStoryGeneratorAgent
         return {
             "jira": JiraAgenticIntegration(),
-            "req": RequirementAnalysisAgent()
+            "req": RequirementAnalysisAgent(),
+            "epic": EpicGeneratorAgent(),
+            "story": UserStoryGeneratorAgent()
         }
 
     # Use cached agents
@@ -621,7 +625,7 @@ def chat_interface():
         
         if "issues_loaded" not in st.session_state:
             with st.spinner("Retrieving project tasks..."):
-                issues = st.session_state.agents["jira"].get_issues_agentic(project_key)
+                issues = st.session_state.agents["jira"].get_issues_agentic(project_key, with_descriptions=True)
                 issues_detail = []
                 for ind, issue in enumerate(issues):
                     issue_text = (
@@ -689,7 +693,7 @@ def chat_interface():
                         jira_guidance = f"JIRA Project Context: {selected_project}\nIssues analyzed: {len(st.session_state.workflow_state.get('selected_issues', []))}\nIssues detail: {st.session_state.workflow_state.get('issues_detail', '')}"
                     else:
                         # Fallback: fetch issues if not cached
-                        issues = st.session_state.agents["jira"].get_issues_agentic(selected_project)
+                        issues = st.session_state.agents["jira"].get_issues_agentic(selected_project, with_descriptions=True)
                         jira_guidance = st.session_state.agents["jira"].generate_context_guidance(
                             issues, st.session_state.workflow_state["hlr"]
                         )
@@ -701,7 +705,7 @@ def chat_interface():
             # Include additional inputs in analysis
             additional_inputs = st.session_state.workflow_state.get("additional_inputs", "")
             
-            analysis = await st.session_state.agents["req"].analyze_requirement(
+            analysis, questions = await st.session_state.agents["req"].analyze_and_question(
                 st.session_state.workflow_state["hlr"], additional_inputs, jira_guidance
             )
             st.session_state.workflow_state["requirement_analysis"] = analysis
@@ -710,13 +714,6 @@ def chat_interface():
             recommended_persona = analysis.get("recommended_persona", "Business Analyst")
             st.session_state.workflow_state["persona"] = recommended_persona
             
-            questions = await st.session_state.agents["req"].generate_questions(
-                st.session_state.workflow_state["hlr"],
-                additional_inputs,
-                st.session_state.workflow_state["slicing_type"],
-                recommended_persona,
-                jira_guidance
-            )
             st.session_state.workflow_state["questions"] = questions
             
             # Save checkpoint after analysis
@@ -818,8 +815,7 @@ def chat_interface():
     elif st.session_state.step == "generate":
         if "generation_done" not in st.session_state:
             async def generate_content():
-                from main import EpicGeneratorAgent, UserStoryGeneratorAgent, GenerationType
-                from openai import OpenAI
+                from main import generate_content as generate_epics_and_stories
                 
                 # Prepare context
                 context = f"Persona: {st.session_state.workflow_state.get('persona', 'Business Analyst')}\n"
@@ -832,29 +828,11 @@ def chat_interface():
                 if st.session_state.workflow_state.get("feedback_history"):
                     context += f"Feedback: {st.session_state.workflow_state['feedback_history']}\n"
                     context += f"Previous iterations: {st.session_state.workflow_state['feedback_count']}\n"
-                         # Initialize OpenAI client
-                api_key = os.getenv('OPENAI_API_KEY')
-                if api_key.startswith('"') and api_key.endswith('"'):
-                    api_key = api_key[1:-1]
-                openai_client = OpenAI(api_key=api_key)
-                
-                epic_agent = EpicGeneratorAgent(openai_client)
-                story_agent = UserStoryGeneratorAgent(openai_client)
                 
                 # Generate content
-                gen_type = st.session_state.workflow_state["generation_type"]
-                hlr = st.session_state.workflow_state["hlr"]
-                responses = st.session_state.workflow_state["responses"]
-                
-                if gen_type in [GenerationType.EPICS_ONLY, GenerationType.BOTH]:
-                    epics = await epic_agent.generate_epics(hlr, context, responses)
-                    st.session_state.workflow_state["epics"] = epics
-                
-                if gen_type in [GenerationType.STORIES_ONLY, GenerationType.BOTH]:
-                    stories = await story_agent.generate_user_stories(
-                        hlr, context, responses, st.session_state.workflow_state.get("epics", [])
-                    )
-                    st.session_state.workflow_state["user_stories"] = stories
+                await generate_epics_and_stories(
+                    st.session_state.agents["epic"], st.session_state.agents["story"], st.session_state.workflow_state, context, regenerate=True
+                )
             
             with st.spinner("Generating content..."):
                 asyncio.run(generate_content())
@@ -5,7 +5,6 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
-from openai import OpenAI
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -40,7 +39,11 @@ class HistoryManager:
         if api_key.startswith('"') and api_key.endswith('"'):
             api_key = api_key[1:-1]
         if api_key:
-            self.openai_client = OpenAI(api_key=api_key)
+            # Imported here so loading history doesn't pull in the SDK; one pooled HTTP/2 connection serves every summary
+            import httpx
+            from openai import OpenAI
+            http_client = httpx.Client(http2=True, limits=httpx.Limits(max_keepalive_connections=20))
+            self.openai_client = OpenAI(api_key=api_key, http_client=http_client)
     
     def _init_database(self):
         """Initialize SQLite database with sessions table"""
@@ -69,10 +72,10 @@ class HistoryManager:
             
             conn.commit()
             conn.close()
-            logger.info(f"Database initialized at {self.db_path}")
+            logger.info("Database initialized at %s", self.db_path)
             
         except Exception as e:
-            logger.error(f"Database initialization error: {e}")
+            logger.error("Database initialization error: %s", e)
             raise
     
     def save_checkpoint(self, state: Dict[str, Any]):
@@ -112,10 +115,10 @@ class HistoryManager:
             
             conn.commit()
             conn.close()
-            logger.info(f"Checkpoint saved for session {state.get('session_id')}")
+            logger.info("Checkpoint saved for session %s", state.get('session_id'))
             
         except Exception as e:
-            logger.error(f"Error saving checkpoint: {e}")
+            logger.error("Error saving checkpoint: %s", e)
     
     def get_all_sessions(self) -> List[Dict[str, Any]]:
         """Retrieve all sessions from history"""
@@ -146,11 +149,11 @@ class HistoryManager:
                 })
             
             conn.close()
-            logger.info(f"Retrieved {len(sessions)} sessions from history")
+            logger.info("Retrieved %s sessions from history", len(sessions))
             return sessions
             
         except Exception as e:
-            logger.error(f"Error retrieving sessions: {e}")
+            logger.error("Error retrieving sessions: %s", e)
             return []
     
     def get_session_state(self, session_id: str) -> Optional[Dict[str, Any]]:
@@ -168,13 +171,13 @@ class HistoryManager:
             
             if row:
                 state = json.loads(row[0])
-                logger.info(f"Retrieved state for session {session_id}")
+                logger.info("Retrieved state for session %s", session_id)
                 return state
             
             return None
             
         except Exception as e:
-            logger.error(f"Error retrieving session state: {e}")
+            logger.error("Error retrieving session state: %s", e)
             return None
     
     def get_agent_summary(self, session: Dict[str, Any]) -> str:
@@ -210,7 +213,7 @@ Provide a brief, actionable summary that helps user decide if they want to resum
             return response.choices[0].message.content.strip()
             
         except Exception as e:
-            logger.error(f"Agent summary error: {e}")
+            logger.error("Agent summary error: %s", e)
             return self._fallback_summary(session)
     
     def _fallback_summary(self, session: Dict[str, Any]) -> str:
@@ -263,7 +266,7 @@ Keep it concise and actionable (3-4 lines max).
             return response.choices[0].message.content.strip()
             
         except Exception as e:
-            logger.error(f"Resume suggestion error: {e}")
+            logger.error("Resume suggestion error: %s", e)
             return self._fallback_resume_suggestion(state)
     
     def _fallback_resume_suggestion(self, state: Dict[str, Any]) -> str:
@@ -290,10 +293,10 @@ Keep it concise and actionable (3-4 lines max).
             
             conn.commit()
             conn.close()
-            logger.info(f"Deleted session {session_id}")
+            logger.info("Deleted session %s", session_id)
             
         except Exception as e:
-            logger.error(f"Error deleting session: {e}")
+            logger.error("Error deleting session: %s", e)
 
 
 def display_history_menu(history_manager: HistoryManager) -> Optional[Dict[str, Any]]:
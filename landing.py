@@ -8,7 +8,9 @@ st.set_page_config(
     layout="wide",
 )
 
+@st.cache_data
 def get_base64_image(image_path):
+    """Base64-encode an image once per process instead of on every rerun"""
     with open(image_path, "rb") as f:
         data = f.read()
         return base64.b64encode(data).decode()
@@ -1,18 +1,35 @@
 import os
+import re
+import argparse
+import sys
 import json
-import uuid
+import atexit
 import asyncio
-import re
 import logging
-from typing import Dict, List, Optional, Any, TypedDict
-from dataclasses import dataclass
+import functools
+import signal
+import weakref
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple, TypedDict
+from dataclasses import dataclass, replace
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from secrets import token_hex
 from enum import Enum
-from openai import OpenAI
+import numpy as np
+import orjson
+from cachetools import TTLCache, cached
 from dotenv import load_dotenv
-from langgraph.graph import StateGraph, START, END
 from jira import JIRA
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+from semantic_cache import SemanticCache, completion_digest, semantic_cache, set_cache_scope, embed_text, embed_texts, recall, remember
+from prompt_toolkit import PromptSession
+from prompt_toolkit.patch_stdout import patch_stdout
 # Import history manager
 from history import HistoryManager, display_history_menu, get_workflow_start_choice
 
@@ -27,12 +44,339 @@ if not logging.getLogger().handlers:
     )
 logger = logging.getLogger(__name__)
 
-class GenerationType(Enum):
+# JIRA search paging and the issue fields the workflow actually reads
+JIRA_PAGE_SIZE = 500
+JIRA_ISSUE_FIELDS = "summary,description,issuetype,status"
+# The CLI's project-wide issue lists skip descriptions; they are fetched only for the issues actually shown
+JIRA_LIST_FIELDS = "summary,issuetype,status"
+# Descriptions shown in listings and guidance are cut to this length
+JIRA_DESC_PREVIEW_CHARS = 150
+
+# JIRA Cloud throttles bursts; jira-python retries 429/5xx responses with backoff up to JIRA_MAX_RETRIES times
+JIRA_REQUESTS_PER_SECOND = 2
+JIRA_BURST = 5
+JIRA_MAX_RETRIES = 5
+JIRA_TIMEOUT = 30
+
+class TokenBucket:
+    """Thread-safe token bucket pacing outgoing requests"""
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+_jira_rate_limiter = TokenBucket(JIRA_REQUESTS_PER_SECOND, JIRA_BURST)
+
+# Short-lived caches so Streamlit reruns don't re-query JIRA for the same data
+_PROJECT_CACHE = TTLCache(maxsize=8, ttl=600)
+_TASKS_CACHE = TTLCache(maxsize=64, ttl=300)
+_ISSUES_CACHE = TTLCache(maxsize=64, ttl=900)
+_EPICS_CACHE = TTLCache(maxsize=64, ttl=900)
+_DESCRIPTIONS_CACHE = TTLCache(maxsize=1024, ttl=900)
+# Issue embeddings per project, reused for every HLR compared against that project
+_ISSUE_VECTORS = TTLCache(maxsize=16, ttl=900)
+_JIRA_CACHE_LOCK = threading.Lock()
+
+def invalidate_jira_cache(project_key: Optional[str] = None):
+    """Drop cached JIRA data for one project, or everything, so the next call refetches"""
+    with _JIRA_CACHE_LOCK:
+        _PROJECT_CACHE.clear()
+        if project_key is None:
+            for cache in (_TASKS_CACHE, _ISSUES_CACHE, _EPICS_CACHE, _DESCRIPTIONS_CACHE, _ISSUE_VECTORS):
+                cache.clear()
+            return
+        for cache in (_TASKS_CACHE, _EPICS_CACHE, _ISSUE_VECTORS):
+            cache.pop(project_key, None)
+        # Issue lists are cached with and without descriptions
+        for with_descriptions in (False, True):
+            _ISSUES_CACHE.pop((project_key, with_descriptions), None)
+        # Issue keys are prefixed with their project key
+        for issue_key in [key for key in _DESCRIPTIONS_CACHE if key.startswith(f"{project_key}-")]:
+            _DESCRIPTIONS_CACHE.pop(issue_key, None)
+
+# Bounds on how much Q&A and epic text is folded into generation prompts
+MAX_CTX_CHARS = 8000
+MAX_CONTEXT_EPICS = 10
+MAX_EPIC_DESC_CHARS = 200
+_PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+
+@functools.cache
+def _load_api_key() -> str:
+    """Read OPENAI_API_KEY once, tolerating a value quoted in the .env file"""
+    api_key = os.getenv('OPENAI_API_KEY', '')
+    if api_key.startswith('"') and api_key.endswith('"'):
+        api_key = api_key[1:-1]
+    return api_key
+
+# The SDK retries 408/409/429/5xx and connection errors with jittered exponential backoff up to OPENAI_MAX_RETRIES times
+OPENAI_MAX_RETRIES = 5
+OPENAI_TIMEOUT = 120
+
+def create_openai_client(api_key: str) -> "AsyncOpenAI":
+    """AsyncOpenAI client backed by a pooled HTTP/2 connection"""
+    # Imported on first use so the CLI and UIs start without loading the SDK
+    import httpx
+    from openai import AsyncOpenAI
+    
+    http_client = httpx.AsyncClient(http2=True, limits=httpx.Limits(max_connections=50, max_keepalive_connections=20))
+    return AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=OPENAI_MAX_RETRIES, timeout=OPENAI_TIMEOUT)
+
+_openai_clients = weakref.WeakKeyDictionary()
+
+def get_openai_client() -> "AsyncOpenAI":
+    """AsyncOpenAI client shared by every agent on the running event loop"""
+    # httpx connection pools belong to the loop that opened them, and the
+    # Streamlit front ends start a new loop for every asyncio.run call
+    loop = asyncio.get_running_loop()
+    if loop not in _openai_clients:
+        _openai_clients[loop] = create_openai_client(_load_api_key())
+    return _openai_clients[loop]
+
+# Per-question validations in flight at once when a batch validation has to be retried item by item
+VALIDATION_CONCURRENCY = 5
+
+# Process-wide memo of JSON-mode completions, keyed on a digest of everything that shapes the reply
+COMPLETION_CACHE_SIZE = 256
+# Replies are JSON objects unless a call supplies a stricter structured-output schema
+JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+# Fixed sampling seed so repeated requests come back as close to identical as the API allows
+COMPLETION_SEED = 42
+# JSON-mode replies can degrade into endless whitespace; raw newlines only ever appear between JSON tokens
+COMPLETION_STOP = ["\n\n\n"]
+_completion_cache = OrderedDict()
+
+def _remember_completion(key: str, content: str):
+    """Add a completion to the in-process LRU memo"""
+    _completion_cache[key] = content
+    if len(_completion_cache) > COMPLETION_CACHE_SIZE:
+        _completion_cache.popitem(last=False)
+
+def _lookup_completion(key: str, persist: bool = True) -> Optional[str]:
+    """Find a completion in the LRU memo, then (when persist is set) in the on-disk cache"""
+    if key in _completion_cache:
+        _completion_cache.move_to_end(key)
+        return _completion_cache[key]
+    if not persist:
+        return None
+    
+    # Second tier survives restarts, so re-running an HLR skips the model entirely
+    try:
+        stored = SemanticCache().get_completion(key)
+    except Exception as e:
+        logger.error("Completion cache lookup failed: %s", e)
+        stored = None
+    if stored is not None:
+        _remember_completion(key, stored)
+    return stored
+
+def _store_completion(key: str, content: str, persist: bool = True):
+    """Add a successful completion to the LRU memo, and to the on-disk cache when persist is set"""
+    _remember_completion(key, content)
+    if not persist:
+        return
+    try:
+        SemanticCache().put_completion(key, content)
+    except Exception as e:
+        logger.error("Completion cache store failed: %s", e)
+
+def _completion_body(model: str, system: str, prompt: str, temperature: float, max_tokens: int,
+                     response_format: Dict[str, Any] = JSON_OBJECT_FORMAT) -> Dict[str, Any]:
+    """Chat completion parameters shared by live and batched requests"""
+    return {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": temperature,
+        "response_format": response_format,
+        "max_tokens": max_tokens,
+        "seed": COMPLETION_SEED,
+        "stop": COMPLETION_STOP
+    }
+
+async def cached_completion(client: "AsyncOpenAI", model: str, system: str, prompt: str,
+                            temperature: float, max_tokens: int,
+                            stream_key: Optional[str] = None, queue: Optional[asyncio.Queue] = None,
+                            response_format: Dict[str, Any] = JSON_OBJECT_FORMAT, persist: bool = True) -> str:
+    """JSON-mode chat completion, answered from the completion caches when the same request was already made.
+    
+    With a queue, the reply is streamed and each element of its `stream_key` array is pushed as soon as it completes.
+    Callers whose results already land in the semantic cache pass persist=False to skip the on-disk tier.
+    """
+    key = completion_digest(model, system, prompt, temperature, max_tokens, response_format)
+    content = _lookup_completion(key, persist)
+    if content is not None:
+        if queue is not None:
+            for item in parse_json_response(content).get(stream_key, []):
+                await queue.put(item)
+        return content
+    
+    response = await client.chat.completions.create(
+        **_completion_body(model, system, prompt, temperature, max_tokens, response_format),
+        stream=queue is not None
+    )
+    if queue is not None:
+        content = await collect_streamed_items(response, stream_key, queue)
+    else:
+        content = response.choices[0].message.content.strip()
+    
+    # Only successful replies are stored; failures raise before reaching here
+    _store_completion(key, content, persist)
+    return content
+
+# Batch jobs usually finish within minutes; back off so a long queue costs few polls
+BATCH_POLL_INITIAL = 5
+BATCH_POLL_MAX = 60
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+async def batch_completions(client: "AsyncOpenAI", requests: List[Tuple[str, str, str, float, int]]) -> List[Optional[str]]:
+    """Run (model, system, prompt, temperature, max_tokens) requests as one Batch API job at half the price.
+    
+    Cached requests are answered locally; an entry is None when its request failed in the batch.
+    """
+    keys = [completion_digest(*request, JSON_OBJECT_FORMAT) for request in requests]
+    results = [_lookup_completion(key) for key in keys]
+    pending = [i for i, content in enumerate(results) if content is None]
+    if not pending:
+        return results
+    
+    lines = b"\n".join(
+        orjson.dumps({"custom_id": str(i), "method": "POST", "url": "/v1/chat/completions", "body": _completion_body(*requests[i])})
+        for i in pending
+    )
+    batch_file = await client.files.create(file=("batch_requests.jsonl", lines), purpose="batch")
+    batch = await client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions", completion_window="24h")
+    logger.info("Submitted batch %s with %s requests", batch.id, len(pending))
+    
+    delay = BATCH_POLL_INITIAL
+    while batch.status not in BATCH_FINAL_STATUSES:
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX)
+        batch = await client.batches.retrieve(batch.id)
+    
+    if not batch.output_file_id:
+        logger.error("Batch %s ended with status %s and no output", batch.id, batch.status)
+        return results
+    
+    output = await client.files.content(batch.output_file_id)
+    for line in output.text.splitlines():
+        record = orjson.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            logger.error("Batch request %s failed: %s", record.get("custom_id"), record.get("error") or response.get("body"))
+            continue
+        
+        i = int(record["custom_id"])
+        results[i] = response["body"]["choices"][0]["message"]["content"].strip()
+        _store_completion(keys[i], results[i])
+    return results
+
+_prompt_session = None
+
+async def ainput(prompt: str = "") -> str:
+    """input() that keeps the event loop running while the user types"""
+    global _prompt_session
+    if not sys.stdin.isatty():
+        return await asyncio.to_thread(input, prompt)
+    if _prompt_session is None:
+        _prompt_session = PromptSession()
+    
+    # Background tasks keep logging while the prompt is up; print above it instead of through it.
+    # StreamHandlers hold the stream they were created with, so point them at the patched stderr too
+    with patch_stdout():
+        handlers = [h for h in logging.getLogger().handlers if type(h) is logging.StreamHandler]
+        previous = [h.setStream(sys.stderr) for h in handlers]
+        try:
+            return await _prompt_session.prompt_async(prompt)
+        finally:
+            for handler, stream in zip(handlers, previous):
+                if stream is not None:
+                    handler.setStream(stream)
+
+# Markdown fences a model occasionally wraps around JSON despite JSON mode
+_JSON_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+def parse_json_response(response: str) -> Dict[str, Any]:
+    """Parse an LLM reply produced in JSON mode"""
+    try:
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
+        pass
+    
+    text = _JSON_FENCE_RE.sub('', response.strip())
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+    
+    # orjson is strict; the stdlib parser still accepts NaN/Infinity that models sometimes emit for scores
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        logger.error("Failed to parse JSON: %s", e)
+        raise ValueError(f"Failed to parse JSON: {e}")
+
+_json_decoder = json.JSONDecoder()
+
+async def collect_streamed_items(stream, key: str, queue: Optional[asyncio.Queue] = None) -> str:
+    """Concatenate a streamed completion, pushing each finished element of the `key` array onto the queue"""
+    buffer = ""
+    pos = None
+    array_closed = False
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        buffer += chunk.choices[0].delta.content or ""
+        if queue is None or array_closed:
+            continue
+        
+        if pos is None:
+            key_at = buffer.find(f'"{key}"')
+            bracket_at = buffer.find("[", key_at) if key_at != -1 else -1
+            if bracket_at == -1:
+                continue
+            pos = bracket_at + 1
+        
+        # Emit every array element that has fully arrived; an incomplete one fails to decode and waits
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                array_closed = True
+                break
+            try:
+                item, pos = _json_decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            await queue.put(item)
+    
+    return buffer.strip()
+
+class GenerationType(str, Enum):
     EPICS_ONLY = "epics_only"
     STORIES_ONLY = "stories_only"
     BOTH = "both"
 
-class AnalysisPhase(Enum):
+class AnalysisPhase(str, Enum):
     INPUT = "input"
     ANALYZING = "analyzing"
     QUESTIONING = "questioning"
@@ -41,7 +385,7 @@ class AnalysisPhase(Enum):
     COMPLETE = "complete"
     ERROR = "error"
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     id: str
     question: str
@@ -53,7 +397,7 @@ class Question:
     answer: str = ""
     skipped: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     is_valid: bool
     overall_score: float
@@ -87,13 +431,13 @@ class WorkflowState(TypedDict):
     has_jira_access: bool
     is_resumed: bool  # New field to track if session is resumed
 
-@dataclass
+@dataclass(slots=True)
 class JIRAProject:
     key: str
     name: str
     description: str
 
-@dataclass
+@dataclass(slots=True)
 class JIRAIssue:
     key: str
     summary: str
@@ -102,8 +446,17 @@ class JIRAIssue:
     status: str
     project_key: str
 
-def strip_code_fences(text: str) -> str:
-    return re.sub(r"^```[a-zA-Z]*\n|\n```$", "", text.strip())
+def _issue_from_json(issue: Dict[str, Any], project_key: str) -> JIRAIssue:
+    """Build a JIRAIssue from a raw search result; fields that weren't requested come back empty"""
+    fields = issue['fields']
+    return JIRAIssue(
+        key=issue['key'],
+        summary=fields.get('summary') or '',
+        description=fields.get('description') or '',
+        issue_type=(fields.get('issuetype') or {}).get('name', ''),
+        status=(fields.get('status') or {}).get('name', ''),
+        project_key=project_key
+    )
 
 class ProjectAccessManager:
     """Agentic manager for project access control"""
@@ -119,17 +472,22 @@ class ProjectAccessManager:
             return
         self.config_file = config_file
         self.allowed_projects = self._load_config()
+        # Set mirror of the ordered list for O(1) membership checks
+        self._allowed_set = set(self.allowed_projects)
+        # Edits are written to disk once, at exit or on an explicit flush()
+        self._dirty = False
+        atexit.register(self.flush)
         self._initialized = True
-        logger.info(f"Project Access Manager initialized with {len(self.allowed_projects)} allowed projects")
+        logger.info("Project Access Manager initialized with %s allowed projects", len(self.allowed_projects))
     
     def _load_config(self) -> List[str]:
         """Load allowed projects from config file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    config = orjson.loads(f.read())
                     projects = config.get('allowed_projects', [])
-                    logger.info(f"Loaded {len(projects)} allowed projects from {self.config_file}")
+                    logger.info("Loaded %s allowed projects from %s", len(projects), self.config_file)
                     return projects
             else:
                 # Create default config
@@ -137,17 +495,17 @@ class ProjectAccessManager:
                     "allowed_projects": ["BU25MVP", "ORI"],
                     "description": "List of JIRA project keys that users can access"
                 }
-                with open(self.config_file, 'w') as f:
-                    json.dump(default_config, f, indent=2)
-                logger.info(f"Created default config file: {self.config_file}")
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
+                logger.info("Created default config file: %s", self.config_file)
                 return default_config['allowed_projects']
         except Exception as e:
-            logger.error(f"Error loading project config: {e}")
+            logger.error("Error loading project config: %s", e)
             return ["BU25MVP", "ORI"]  # Fallback
     
     def is_project_allowed(self, project_key: str) -> bool:
         """Check if project is in allowed list"""
-        return project_key in self.allowed_projects
+        return project_key in self._allowed_set
     
     def get_allowed_projects(self) -> List[str]:
         """Get list of allowed projects"""
@@ -155,17 +513,27 @@ class ProjectAccessManager:
     
     def add_project(self, project_key: str):
         """Add project to allowed list"""
-        if project_key not in self.allowed_projects:
+        if project_key not in self._allowed_set:
             self.allowed_projects.append(project_key)
-            self._save_config()
-            logger.info(f"Added project {project_key} to allowed list")
+            self._allowed_set.add(project_key)
+            self._dirty = True
+            invalidate_jira_cache(project_key)
+            logger.info("Added project %s to allowed list", project_key)
     
     def remove_project(self, project_key: str):
         """Remove project from allowed list"""
-        if project_key in self.allowed_projects:
+        if project_key in self._allowed_set:
             self.allowed_projects.remove(project_key)
+            self._allowed_set.discard(project_key)
+            self._dirty = True
+            invalidate_jira_cache(project_key)
+            logger.info("Removed project %s from allowed list", project_key)
+    
+    def flush(self):
+        """Write pending allowed-list changes to the config file"""
+        if self._dirty:
             self._save_config()
-            logger.info(f"Removed project {project_key} from allowed list")
+            self._dirty = False
     
     def _save_config(self):
         """Save current config to file"""
@@ -175,14 +543,32 @@ class ProjectAccessManager:
                 "description": "List of JIRA project keys that users can access",
                 "last_updated": datetime.now().isoformat()
             }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-            logger.info(f"Saved config to {self.config_file}")
+            with open(self.config_file, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            logger.info("Saved config to %s", self.config_file)
         except Exception as e:
-            logger.error(f"Error saving config: {e}")
+            logger.error("Error saving config: %s", e)
+
+# Static parts of the JIRA context guidance
+_GUIDANCE_NOTES = """
+Interpretation Guidelines:
+- Use issue types to understand the mix of work (Epics, Stories).
+- Use status distribution to gauge workflow progress, backlog size, and team throughput.
+- Treat Epics as strategic areas and Stories as functional requirements.
+
+Objective:
+- Derive actionable context to guide design of the following High-Level Requirement (HLR).
+- Ensure the HLR aligns with current project scope, avoids redundancy, and fits capacity limits.
+"""
+
+_GUIDANCE_RECOMMENDATIONS = """1. Consider existing issue patterns and functional areas.
+2. Align with current project workflow
+3. Leverage project structure and naming conventions
+4. Account for team capacity based on status distribution
+"""
 
 class JiraAgenticIntegration:
-    """Fully agentic JIRA integration using OpenAI and jira-python"""
+    """JIRA integration built on jira-python"""
     _instance = None
     
     def __new__(cls):
@@ -206,125 +592,160 @@ class JiraAgenticIntegration:
             try:
                 self.jira_client = JIRA(
                     server=self.server,
-                    basic_auth=(email, api_token)
+                    basic_auth=(email, api_token),
+                    max_retries=JIRA_MAX_RETRIES,
+                    timeout=JIRA_TIMEOUT
                 )
+                # The client's pooled session keeps TLS connections warm between calls; release them on exit
+                atexit.register(self.close)
                 logger.info("Agentic JIRA integration configured successfully")
             except Exception as e:
-                logger.error(f"JIRA client failed to initialize: {e}")
+                logger.error("JIRA client failed to initialize: %s", e)
                 self.jira_client = None
         else:
             self.jira_client = None
             logger.warning("JIRA credentials not configured")
         
-        # Initialize OpenAI client
-        api_key = os.getenv('OPENAI_API_KEY', '')
-        if api_key.startswith('"') and api_key.endswith('"'):
-            api_key = api_key[1:-1]
-        self.openai_client = OpenAI(api_key=api_key)
         self._initialized = True
     
-    def _execute_jira_agent_task(self, task: str) -> str:
-        """Execute JIRA task using agent-generated code"""
-        try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "developer", "content": """You are a very good python developer who has very good knowledge in jira-python library. Your task is to write executable python code to interact with jira to achieve the task given by the user. The authentication is done and connection is established to jira and instance of jira is created in jira_instance. Return only executable python code with the final result stored in variable 'final_response' which will be used to access the result. Do not add any explanation and return only the executable code as I am directly feeding your response to exec method."""},
-                    {"role": "user", "content": task}
-                ],
-                temperature=0.3
-            )
-            
-            python_code = strip_code_fences(response.choices[0].message.content)
-            
-            # Execute agent-generated code
-            context = {"jira_instance": self.jira_client, "final_response": "No result"}
-            exec(python_code, {}, context)
-            
-            return context.get("final_response", "No result")
-            
-        except Exception as e:
-            logger.error(f"Error executing JIRA agent task: {e}")
-            return f"Error: {str(e)}"
+    def invalidate(self, project_key: Optional[str] = None):
+        """Force fresh JIRA data on the next call"""
+        invalidate_jira_cache(project_key)
+    
+    def close(self):
+        """Close the JIRA client's pooled HTTP session"""
+        if self.jira_client:
+            self.jira_client.close()
+            self.jira_client = None
     
     def get_projects_agentic(self) -> List[JIRAProject]:
-        """Agentically retrieve and filter projects"""
+        """Retrieve the projects the user is allowed to access"""
         if not self.jira_client:
             logger.error("JIRA client not available")
             return []
         
         try:
-            allowed_keys = self.access_manager.get_allowed_projects()
-            
-            if not allowed_keys:
+            if not self.access_manager.get_allowed_projects():
                 logger.warning("No allowed projects configured")
                 return []
             
-            # Use agent to fetch projects
-            allowed_keys_str = ", ".join(allowed_keys)
-            task = f"Retrieve project details for these project keys: {allowed_keys_str}. Return a list of dicts with 'key', 'name', and 'description' for each project."
-            
-            result = self._execute_jira_agent_task(task)
+            projects = self._fetch_allowed_projects()
             
-            # Parse result and convert to JIRAProject objects
-            if isinstance(result, str):
-                result = json.loads(result) if result.startswith('[') or result.startswith('{') else []
-            
-            projects = []
-            for proj_data in result:
-                if isinstance(proj_data, dict):
-                    projects.append(JIRAProject(
-                        key=proj_data.get('key', ''),
-                        name=proj_data.get('name', ''),
-                        description=proj_data.get('description', '')
-                    ))
-            
-            logger.info(f"Successfully retrieved {len(projects)} accessible projects")
+            logger.info("Successfully retrieved %s accessible projects", len(projects))
             return projects
             
         except Exception as e:
-            logger.error(f"Error in agentic project retrieval: {e}")
+            logger.error("Error in project retrieval: %s", e)
             return []
     
-    def get_issues_agentic(self, project_key: str) -> List[JIRAIssue]:
-        """Agentically retrieve issues"""
+    def _jira_call(self, method, *args, **kwargs):
+        """Invoke a JIRA client method once the shared rate limiter allows it"""
+        _jira_rate_limiter.acquire()
+        return method(*args, **kwargs)
+    
+    @cached(_PROJECT_CACHE, key=lambda self: "projects", lock=_JIRA_CACHE_LOCK)
+    def _fetch_allowed_projects(self) -> List[JIRAProject]:
+        """List allowed projects; cached so reruns skip the JIRA round-trip"""
+        return [
+            JIRAProject(
+                key=project.key,
+                name=project.name,
+                description=getattr(project, 'description', '') or ''
+            )
+            for project in self._jira_call(self.jira_client.projects)
+            if self.access_manager.is_project_allowed(project.key)
+        ]
+    
+    def _search_page(self, jql: str, start: int, max_results: int, fields: str) -> Dict[str, Any]:
+        """One raw search page; json_result skips building a Resource object tree for every issue"""
+        return self._jira_call(self.jira_client.search_issues, jql, startAt=start, maxResults=max_results, fields=fields, json_result=True)
+    
+    def _fetch_pages_parallel(self, jql: str, fields: str = JIRA_ISSUE_FIELDS, max_workers: int = 5, batch_size: int = JIRA_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """Fetch every issue matching the JQL as raw JSON, requesting the remaining pages concurrently"""
+        first_page = self._search_page(jql, 0, batch_size, fields)
+        issues, total = first_page['issues'], first_page['total']
+        if not issues or len(issues) >= total:
+            return issues
+        
+        # The server may cap maxResults below what was asked for; page with what it actually returns
+        page_size = len(issues)
+        if page_size < batch_size:
+            logger.warning("JIRA server returned %s issues for maxResults=%s, paging with %s", page_size, batch_size, page_size)
+        
+        pages = {0: issues}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._search_page, jql, start, page_size, fields): start
+                for start in range(page_size, total, page_size)
+            }
+            for future in as_completed(futures):
+                pages[futures[future]] = future.result()['issues']
+        
+        # Reassemble in page order so results stay stable across runs
+        return [issue for start in sorted(pages) for issue in pages[start]]
+    
+    def get_issues_agentic(self, project_key: str, with_descriptions: bool = False) -> List[JIRAIssue]:
+        """Retrieve all issues of an allowed project; descriptions only when with_descriptions is set"""
         if not self.jira_client:
             return []
         
         if not self.access_manager.is_project_allowed(project_key):
-            logger.warning(f"Access denied to project {project_key}")
+            logger.warning("Access denied to project %s", project_key)
             return []
         
         try:
-            task = f"For project '{project_key}', retrieve all issues (max 100) with fields: key, summary, description, issue type, status. Return as list of dicts."
-            
-            result = self._execute_jira_agent_task(task)
-            
-            # Parse result
-            if isinstance(result, str):
-                result = json.loads(result) if result.startswith('[') else []
-            
-            jira_issues = []
-            for issue_data in result:
-                if isinstance(issue_data, dict):
-                    jira_issues.append(JIRAIssue(
-                        key=issue_data.get('key', ''),
-                        summary=issue_data.get('summary', ''),
-                        description=issue_data.get('description', ''),
-                        issue_type=issue_data.get('issue_type', ''),
-                        status=issue_data.get('status', ''),
-                        project_key=project_key
-                    ))
-            
-            logger.info(f"Retrieved {len(jira_issues)} issues from {project_key}")
+            jira_issues = list(self._fetch_issues(project_key, with_descriptions))
+            logger.info("Retrieved %s issues from %s", len(jira_issues), project_key)
             return jira_issues
             
         except Exception as e:
-            logger.error(f"Error getting issues: {e}")
+            logger.error("Error getting issues: %s", e)
+            return []
+    
+    @cached(_ISSUES_CACHE, key=lambda self, project_key, with_descriptions: (project_key, with_descriptions), lock=_JIRA_CACHE_LOCK)
+    def _fetch_issues(self, project_key: str, with_descriptions: bool) -> List[JIRAIssue]:
+        """Fetch a project's issues; cached so every node reuses one JIRA round-trip"""
+        jql = f'project = "{project_key}" ORDER BY created ASC'
+        fields = JIRA_ISSUE_FIELDS if with_descriptions else JIRA_LIST_FIELDS
+        return [_issue_from_json(issue, project_key) for issue in self._fetch_pages_parallel(jql, fields=fields)]
+    
+    def get_epics_agentic(self, project_key: str) -> List[JIRAIssue]:
+        """Retrieve a project's epics, descriptions included"""
+        if not self.jira_client or not self.access_manager.is_project_allowed(project_key):
+            return []
+        
+        try:
+            return list(self._fetch_epics(project_key))
+        except Exception as e:
+            logger.error("Error getting epics: %s", e)
             return []
     
+    @cached(_EPICS_CACHE, key=lambda self, project_key: project_key, lock=_JIRA_CACHE_LOCK)
+    def _fetch_epics(self, project_key: str) -> List[JIRAIssue]:
+        """Fetch a project's epics with their descriptions; cached per project key"""
+        jql = f'project = "{project_key}" AND issuetype = Epic ORDER BY created ASC'
+        return [_issue_from_json(epic, project_key) for epic in self._fetch_pages_parallel(jql)]
+    
+    def get_issue_descriptions(self, issue_keys: List[str]) -> Dict[str, str]:
+        """Lazily fetch description previews for selected issues in one search"""
+        with _JIRA_CACHE_LOCK:
+            missing = [key for key in issue_keys if key not in _DESCRIPTIONS_CACHE]
+        
+        if missing and self.jira_client:
+            try:
+                fetched = self._fetch_pages_parallel(f"key in ({','.join(missing)})", fields="description")
+                with _JIRA_CACHE_LOCK:
+                    for issue in fetched:
+                        # Only the preview is ever shown, so the full text is never kept
+                        _DESCRIPTIONS_CACHE[issue['key']] = (issue['fields'].get('description') or '')[:JIRA_DESC_PREVIEW_CHARS]
+            except Exception as e:
+                logger.error("Error getting issue descriptions: %s", e)
+        
+        with _JIRA_CACHE_LOCK:
+            return {key: _DESCRIPTIONS_CACHE.get(key, '') for key in issue_keys}
+    
     def get_all_tasks_agentic(self, project_key: str) -> str:
-        """Get only epics from project using agent"""
+        """Get only epics from project"""
         if not self.jira_client:
             return "JIRA client not available"
         
@@ -332,52 +753,145 @@ class JiraAgenticIntegration:
             return f"Access denied to project {project_key}"
         
         try:
-            task = f"""For project '{project_key}', retrieve ONLY Epic type issues and format them:
-    - Total epic count
-    - Each epic with: Key, Title, Status, Description (first 150 chars)
-    Return formatted string output showing only Epics."""
-            
-            result = self._execute_jira_agent_task(task)
-            return result
+            return self._format_epics(project_key)
                 
         except Exception as e:
-            logger.error(f"Error in agentic epic retrieval: {e}")
-            return f"Error: {str(e)}"    
+            logger.error("Error in epic retrieval: %s", e)
+            return f"Error: {str(e)}"
         
-    def generate_context_guidance(self, issues: List[JIRAIssue], hlr: str) -> str:
+    @cached(_TASKS_CACHE, key=lambda self, project_key: project_key, lock=_JIRA_CACHE_LOCK)
+    def _format_epics(self, project_key: str) -> str:
+        """Format a project's epics; cached per project key"""
+        epics = self._fetch_epics(project_key)
+        
+        lines = [f"Total epics: {len(epics)}"]
+        for epic in epics:
+            lines.append(f"\n{epic.key}: {epic.summary}")
+            lines.append(f"   Status: {epic.status}")
+            lines.append(f"   Description: {epic.description[:JIRA_DESC_PREVIEW_CHARS]}")
+        return "\n".join(lines)
+    
+    async def find_related_issues(self, project_key: str, issues: List[JIRAIssue], hlr: str, top_k: int = 5) -> List[JIRAIssue]:
+        """Rank a project's issues by embedding similarity to the HLR"""
+        if not issues:
+            return []
+        
+        try:
+            client = get_openai_client()
+            issue_keys = tuple(issue.key for issue in issues)
+            cached = _ISSUE_VECTORS.get(project_key)
+            if cached is None or cached[0] != issue_keys:
+                # One batched request embeds the whole project instead of one call per issue
+                vectors = await embed_texts(client, [issue.summary for issue in issues])
+                _ISSUE_VECTORS[project_key] = cached = (issue_keys, vectors)
+            
+            scores = cached[1] @ await embed_text(client, hlr)
+            related = [issues[i] for i in scores.argsort()[::-1][:top_k]]
+            # Only the few issues that end up in the prompt need their descriptions
+            descriptions = await asyncio.to_thread(self.get_issue_descriptions, [issue.key for issue in related])
+            return [replace(issue, description=descriptions[issue.key]) for issue in related]
+        except Exception as e:
+            logger.error("Error ranking related issues: %s", e)
+            return []
+    
+    def generate_context_guidance(self, issues: List[JIRAIssue], hlr: str, related: Optional[List[JIRAIssue]] = None) -> str:
         """Generate agentic guidance based on JIRA context"""
         if not issues:
             return ""
         
-        issue_types = {}
-        statuses = {}
+        issue_types = Counter(issue.issue_type for issue in issues)
+        statuses = Counter(issue.status for issue in issues)
         
-        for issue in issues:
-            issue_types[issue.issue_type] = issue_types.get(issue.issue_type, 0) + 1
-            statuses[issue.status] = statuses.get(issue.status, 0) + 1
-        
-        guidance = f"""
-JIRA Project Context Analysis:
-- Total Issues: {len(issues)}
-- Issue Types: {dict(sorted(issue_types.items(), key=lambda x: x[1], reverse=True))}
-- Status Distribution: {dict(sorted(statuses.items(), key=lambda x: x[1], reverse=True))}
-
-Interpretation Guidelines:
-- Use issue types to understand the mix of work (Epics, Stories).
-- Use status distribution to gauge workflow progress, backlog size, and team throughput.
-- Treat Epics as strategic areas and Stories as functional requirements.
-
-Objective:
-- Derive actionable context to guide design of the following High-Level Requirement (HLR).
-- Ensure the HLR aligns with current project scope, avoids redundancy, and fits capacity limits.
-
-Contextual Recommendations for HLR "{hlr}":
-1. Consider existing issue patterns and functional areas.
-2. Align with current project workflow
-3. Leverage project structure and naming conventions
-4. Account for team capacity based on status distribution
-"""
-        return guidance
+        parts = [
+            "",
+            "JIRA Project Context Analysis:",
+            f"- Total Issues: {len(issues)}",
+            f"- Issue Types: {dict(issue_types.most_common())}",
+            f"- Status Distribution: {dict(statuses.most_common())}",
+            _GUIDANCE_NOTES,
+            f'Contextual Recommendations for HLR "{hlr}":',
+            _GUIDANCE_RECOMMENDATIONS,
+        ]
+        if related:
+            parts.append("Most Related Existing Issues:")
+            parts.extend(
+                f"- {issue.key} [{issue.issue_type}] {issue.summary}" + (f": {issue.description[:JIRA_DESC_PREVIEW_CHARS]}" if issue.description else "")
+                for issue in related
+            )
+        return "\n".join(parts)
+
+# Returned when requirement analysis fails; never stored in the semantic cache
+_DEFAULT_ANALYSIS = {
+    "slicing_type": "functional",
+    "recommended_persona": "Business Analyst", 
+    "domain": "general",
+    "complexity": "Medium",
+    "user_types": ["user"],
+    "main_features": [],
+    "confidence": 0.5
+}
+
+def _strict_object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Object schema in the form OpenAI's strict structured outputs require"""
+    return {"type": "object", "properties": properties, "required": list(properties), "additionalProperties": False}
+
+def _schema_format(name: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+    """response_format that makes the API return exactly this object shape"""
+    return {"type": "json_schema", "json_schema": {"name": name, "strict": True, "schema": _strict_object(properties)}}
+
+_STRING = {"type": "string"}
+_STRINGS = {"type": "array", "items": _STRING}
+
+_ANALYSIS_PROPERTIES = {
+    "slicing_type": {"type": "string", "enum": ["functional", "technical", "user_journey"]},
+    "slicing_type_reasoning": _STRING,
+    "recommended_persona": _STRING,
+    "persona_reasoning": _STRING,
+    "domain": _STRING,
+    "domain_reasoning": _STRING,
+    "complexity": {"type": "string", "enum": ["Low", "Medium", "High"]},
+    "complexity_reasoning": _STRING,
+    "user_types": _STRINGS,
+    "user_types_reasoning": _STRING,
+    "main_features": _STRINGS,
+    "main_features_reasoning": _STRING,
+    "confidence": {"type": "number"},
+}
+_QUESTIONS_PROPERTY = {
+    "type": "array",
+    "items": _strict_object({
+        "question": _STRING,
+        "context": _STRING,
+        "reasoning": _STRING,
+        "priority": {"type": "integer"},
+        "required": {"type": "boolean"},
+    }),
+}
+_VALIDATION_PROPERTIES = {
+    "is_valid": {"type": "boolean"},
+    "overall_score": {"type": "number"},
+    "issues": _STRINGS,
+    "suggestions": _STRINGS,
+    "confidence": {"type": "number"},
+}
+
+ANALYSIS_FORMAT = _schema_format("requirement_analysis", _ANALYSIS_PROPERTIES)
+QUESTIONS_FORMAT = _schema_format("questions", {"questions": _QUESTIONS_PROPERTY})
+ANALYSIS_QUESTIONS_FORMAT = _schema_format(
+    "analysis_and_questions", {"analysis": _strict_object(_ANALYSIS_PROPERTIES), "questions": _QUESTIONS_PROPERTY}
+)
+VALIDATION_FORMAT = _schema_format("validation", _VALIDATION_PROPERTIES)
+VALIDATION_BATCH_FORMAT = _schema_format(
+    "validation_batch", {"results": {"type": "array", "items": _strict_object(_VALIDATION_PROPERTIES)}}
+)
+
+def _questions_from_cache(data: List[Dict]) -> List[Question]:
+    """Rebuild cached questions with fresh ids so sessions never share answer keys"""
+    return [Question(**{**q, "id": f"q_{token_hex(4)}"}) for q in data]
+
+def _analysis_and_questions_from_cache(data: List[Any]) -> Tuple[Dict[str, Any], List[Question]]:
+    """Rebuild a cached (analysis, questions) pair"""
+    return data[0], _questions_from_cache(data[1])
 
 class RequirementAnalysisAgent:
     _instance = None
@@ -391,16 +905,14 @@ class RequirementAnalysisAgent:
         if hasattr(self, '_initialized'):
             return
             
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
+        if not _load_api_key():
             raise ValueError("OPENAI_API_KEY not found")
         
-        if api_key.startswith('"') and api_key.endswith('"'):
-            api_key = api_key[1:-1]
-        
-        self.client = OpenAI(api_key=api_key)
-        self.model = "gpt-4"
-        self.temperature = 0.3
+        # Short structured checks run on the fast model, open-ended analysis on the strong one
+        self.model_fast = "gpt-4o-mini"
+        self.model_strong = "gpt-4o"
+        # Analysis, questions and validation are structured extraction; keep sampling tight
+        self.temperature = 0.1
         
         self.slicing_config = {
             "functional": {
@@ -423,9 +935,17 @@ class RequirementAnalysisAgent:
             }
         }
         
+        # Static part of the combined prompt, rendered once rather than on every call
+        self._focus_areas_text = "\n".join(f"- {key}: {info['focus_areas']}" for key, info in self.slicing_config.items())
+        
         self._initialized = True
         logger.info("Requirement Analysis Agent initialized")
     
+    @property
+    def client(self) -> "AsyncOpenAI":
+        return get_openai_client()
+    
+    @semantic_cache("analysis", cache_if=lambda result: result != _DEFAULT_ANALYSIS, derived_from_hlr=("jira_guidance",))
     async def analyze_requirement(self, hlr: str, additional_inputs: str, jira_guidance: str = "") -> Dict[str, Any]:
         additional_context = f"\nAdditional User Inputs: {additional_inputs}" if additional_inputs else ""
         
@@ -472,22 +992,15 @@ Reply ONLY with the above structure, filled in, as a JSON object.
 """
         
         try:
-            response = await self._call_openai(analysis_prompt)
-            result = self._parse_json_response(response)
-            logger.info(f"Analysis completed: {result.get('slicing_type')}")
+            response = await self._call_openai(analysis_prompt, self.model_strong, max_tokens=1000, response_format=ANALYSIS_FORMAT, persist=False)
+            result = parse_json_response(response)
+            logger.info("Analysis completed: %s", result.get('slicing_type'))
             return result
         except Exception as e:
-            logger.error(f"Error analyzing requirement: {e}")
-            return {
-                "slicing_type": "functional",
-                "recommended_persona": "Business Analyst", 
-                "domain": "general",
-                "complexity": "Medium",
-                "user_types": ["user"],
-                "main_features": [],
-                "confidence": 0.5
-            }
+            logger.error("Error analyzing requirement: %s", e)
+            return dict(_DEFAULT_ANALYSIS)
     
+    @semantic_cache("questions", decode=_questions_from_cache, derived_from_hlr=("jira_guidance",))
     async def generate_questions(self, hlr: str, additional_inputs: str, slicing_type: str, persona: str, jira_guidance: str = "") -> List[Question]:
         slicing_info = self.slicing_config.get(slicing_type, self.slicing_config["functional"])
         additional_context = f"\n- Additional User Inputs: {additional_inputs}" if additional_inputs else ""
@@ -539,28 +1052,118 @@ Reply ONLY with the JSON object, no additional text.
 """
         
         try:
-            response = await self._call_openai(question_prompt)
-            question_data = self._parse_json_response(response)
-            
-            questions = []
-            for q_data in question_data.get('questions', []):
-                question = Question(
-                    id=f"q_{uuid.uuid4().hex[:8]}",
-                    question=q_data['question'],
-                    context=q_data.get('context', ''),
-                    reasoning=q_data.get('reasoning', ''),
-                    priority=q_data.get('priority', 3),
-                    required=q_data.get('required', True)
-                )
-                questions.append(question)
-            
-            logger.info(f"Generated {len(questions)} questions")
+            response = await self._call_openai(question_prompt, self.model_fast, max_tokens=800, response_format=QUESTIONS_FORMAT, persist=False)
+            questions = self._build_questions(parse_json_response(response))
+            logger.info("Generated %s questions", len(questions))
             return questions
             
         except Exception as e:
-            logger.error(f"Error generating questions: {e}")
+            logger.error("Error generating questions: %s", e)
             return []
     
+    @semantic_cache(
+        "analysis_questions",
+        decode=_analysis_and_questions_from_cache,
+        cache_if=lambda result: result[0] != _DEFAULT_ANALYSIS and bool(result[1]),
+        derived_from_hlr=("jira_guidance",)
+    )
+    async def analyze_and_question(self, hlr: str, additional_inputs: str, jira_guidance: str = "") -> Tuple[Dict[str, Any], List[Question]]:
+        """Analyze the HLR and draft questions for the recommended persona in one call"""
+        additional_context = f"\nAdditional User Inputs: {additional_inputs}" if additional_inputs else ""
+        
+        combined_prompt = f"""
+You are an expert Business Analyst specializing in requirement analysis, with deep Agile and JIRA experience.
+
+HLR: "{hlr}"
+{additional_context}
+
+{jira_guidance}
+
+Step 1 - Analyze the HLR.
+- Select 'slicing_type' from: "functional", "technical", "user_journey" ONLY.
+  - functional: Break down by business functions and workflows
+  - technical: Break down by technical components and system layers
+  - user_journey: Break down by user personas and interaction journeys
+- Select 'complexity' as one of: "Low", "Medium", "High".
+- Provide meaningful entries for all fields; if not inferable, use "N/A".
+- For each field, include a brief reasoning (1-2 sentences max) explaining your choice.
+- Ensure reasoning aligns with Agile/BA best practices (INVEST, value-driven analysis).
+
+Step 2 - Acting as the recommended persona, generate 5-7 specific, actionable questions to decompose this HLR
+using the focus areas of the slicing type you selected:
+{self._focus_areas_text}
+
+Requirements for each question:
+- "question": Concise question text.
+- "context": Brief explanation why this question is important.
+- "reasoning": How it helps break down the HLR.
+- "priority": Integer (1=highest priority).
+- "required": true if mandatory for clarification, false otherwise.
+If any aspect of the HLR is ambiguous or missing info, design questions to clarify it.
+
+Response format (JSON ONLY):
+{{
+    "analysis": {{
+        "slicing_type": "functional|technical|user_journey",
+        "slicing_type_reasoning": "...",
+        "recommended_persona": "most suitable persona",
+        "persona_reasoning": "...",
+        "domain": "identified business domain",
+        "domain_reasoning": "...",
+        "complexity": "Low|Medium|High",
+        "complexity_reasoning": "...",
+        "user_types": ["list of user personas"],
+        "user_types_reasoning": "...",
+        "main_features": ["key functional areas"],
+        "main_features_reasoning": "...",
+        "confidence": 0.0-1.0
+    }},
+    "questions": [
+        {{
+            "question": "What specific user roles will interact with this system?",
+            "context": "Understanding user types helps define personas",
+            "reasoning": "User roles impact story structure",
+            "priority": 1,
+            "required": true
+        }}
+    ]
+}}
+
+Reply ONLY with the JSON object, no additional text.
+"""
+        
+        try:
+            response = await self._call_openai(combined_prompt, self.model_strong, max_tokens=1800, response_format=ANALYSIS_QUESTIONS_FORMAT, persist=False)
+            data = parse_json_response(response)
+            analysis = data['analysis']
+            questions = self._build_questions(data)
+            if not questions:
+                raise ValueError("No questions in combined response")
+            logger.info("Analysis completed: %s, generated %s questions", analysis.get('slicing_type'), len(questions))
+            return analysis, questions
+        except Exception as e:
+            logger.error("Combined analysis failed, falling back to separate calls: %s", e)
+            analysis = await self.analyze_requirement(hlr, additional_inputs, jira_guidance)
+            questions = await self.generate_questions(
+                hlr, additional_inputs, analysis.get("slicing_type", "functional"),
+                analysis.get("recommended_persona", "Business Analyst"), jira_guidance
+            )
+            return analysis, questions
+    
+    def _build_questions(self, question_data: Dict[str, Any]) -> List[Question]:
+        """Turn parsed question JSON into Question objects with fresh ids"""
+        return [
+            Question(
+                id=f"q_{token_hex(4)}",
+                question=q_data['question'],
+                context=q_data.get('context', ''),
+                reasoning=q_data.get('reasoning', ''),
+                priority=q_data.get('priority', 3),
+                required=q_data.get('required', True)
+            )
+            for q_data in question_data.get('questions', [])
+        ]
+    
     async def validate_response(self, hlr: str, question: Question, user_response: str) -> ValidationResult:
         validation_prompt = f"""
 You are an expert Business Analyst and AI evaluator specializing in validating requirement analysis responses.
@@ -590,8 +1193,8 @@ Respond ONLY with a JSON object as below:
 """
         
         try:
-            response = await self._call_openai(validation_prompt)
-            validation_data = self._parse_json_response(response)
+            response = await self._call_openai(validation_prompt, self.model_fast, max_tokens=300, response_format=VALIDATION_FORMAT)
+            validation_data = parse_json_response(response)
             
             result = ValidationResult(
                 is_valid=validation_data['is_valid'],
@@ -601,11 +1204,11 @@ Respond ONLY with a JSON object as below:
                 confidence=validation_data['confidence']
             )
             
-            logger.info(f"Validation completed: {'valid' if result.is_valid else 'invalid'}")
+            logger.info("Validation completed: %s", 'valid' if result.is_valid else 'invalid')
             return result
             
         except Exception as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             return ValidationResult(
                 is_valid=True,
                 overall_score=0.7,
@@ -614,49 +1217,98 @@ Respond ONLY with a JSON object as below:
                 confidence=0.5
             )
     
-    async def _call_openai(self, prompt: str) -> str:
+    async def validate_responses_batch(self, hlr: str, qa_pairs: List[Tuple[Question, str]]) -> List[ValidationResult]:
+        """Validate several Q&A responses with a single LLM call"""
+        if not qa_pairs:
+            return []
+        
+        items = "\n".join(
+            f'{i}. Question: "{question.question}"\n   Response: "{user_response}"'
+            for i, (question, user_response) in enumerate(qa_pairs, 1)
+        )
+        
+        validation_prompt = f"""
+You are an expert Business Analyst and AI evaluator specializing in validating requirement analysis responses.
+Validate each of the following user responses to requirement analysis questions.
+
+HLR: "{hlr}"
+
+{items}
+
+Validate each response for: relevance, completeness, clarity, actionability
+
+For every numbered item, in the same order, provide a JSON evaluation with:
+- "is_valid": true if the response satisfactorily answers the question; false otherwise.
+- "overall_score": float 0.0 to 1.0 estimating overall quality.
+- "issues": list of specific issues found in the response; empty list if none.
+- "suggestions": list of concrete suggestions to improve the response; empty list if none.
+- "confidence": your confidence in the evaluation, 0.0 to 1.0.
+
+Respond ONLY with a JSON object as below, with exactly {len(qa_pairs)} results:
+{{
+    "results": [
+        {{
+            "is_valid": true|false,
+            "overall_score": 0.0-1.0,
+            "issues": ["list of issues"],
+            "suggestions": ["improvement suggestions"],
+            "confidence": 0.0-1.0
+        }}
+    ]
+}}
+"""
+        
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert requirements analyst. Respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=2000
+            response = await self._call_openai(
+                validation_prompt, self.model_fast, max_tokens=300 * len(qa_pairs), response_format=VALIDATION_BATCH_FORMAT
             )
-            return response.choices[0].message.content.strip()
+            results_data = parse_json_response(response).get('results', [])
+            if len(results_data) != len(qa_pairs):
+                raise ValueError(f"Expected {len(qa_pairs)} validation results, got {len(results_data)}")
+            
+            results = [
+                ValidationResult(
+                    is_valid=validation_data['is_valid'],
+                    overall_score=validation_data['overall_score'],
+                    issues=validation_data['issues'],
+                    suggestions=validation_data['suggestions'],
+                    confidence=validation_data['confidence']
+                )
+                for validation_data in results_data
+            ]
+            
+            logger.info("Batch validation completed: %s/%s valid", sum(r.is_valid for r in results), len(results))
+            return results
+            
         except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
-            raise
+            logger.error("Batch validation error, validating responses individually: %s", e)
+            # Validate each response concurrently rather than waving the whole batch through
+            semaphore = asyncio.Semaphore(VALIDATION_CONCURRENCY)
+            
+            async def validate_one(question: Question, user_response: str) -> ValidationResult:
+                async with semaphore:
+                    return await self.validate_response(hlr, question, user_response)
+            
+            return list(await asyncio.gather(*(validate_one(q, r) for q, r in qa_pairs)))
     
-    def _parse_json_response(self, response: str) -> Dict[str, Any]:
+    async def _call_openai(self, prompt: str, model: str, max_tokens: int = 2000,
+                           response_format: Dict[str, Any] = JSON_OBJECT_FORMAT, persist: bool = True) -> str:
         try:
-            cleaned_response = re.sub(r'```json\n?|\n?```', '', response.strip())
-            return json.loads(cleaned_response)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {e}")
-            raise ValueError(f"Failed to parse JSON: {e}")
+            return await cached_completion(
+                self.client, model,
+                "You are an expert requirements analyst. Respond with valid JSON only.",
+                prompt, self.temperature, max_tokens, response_format=response_format, persist=persist
+            )
+        except Exception as e:
+            logger.error("OpenAI API error: %s", e)
+            raise
 
-class EpicGeneratorAgent:
-    def __init__(self, openai_client: OpenAI):
-        self.client = openai_client
-        self.model = "gpt-4"
-        self.temperature = 0.3
-        logger.info("Epic Generator Agent initialized")
-    
-    async def generate_epics(self, hlr: str, context: str, qa_responses: Dict[str, str]) -> List[Dict]:
-        qa_context = self._build_qa_context(qa_responses)
-        
-        epic_prompt = f"""
+# Fixed instructions go in the system message so every generation call shares a byte-identical prefix
+# for OpenAI's automatic prompt caching; only the requirement-specific context follows in the user message
+_EPIC_INSTRUCTIONS = """
 ## Role 
 You are an expert Agile Epic writer for JIRA with extensive experience in enterprise and scaled Agile frameworks.
 
-## Context
-- High-Level Requirement (HLR): "{hlr}"
-- Additional Context: {context}
-- Q&A Insights: {qa_context}
-
 ## Task
 Generate 2 to 4 comprehensive epics that together cover the HLR.
 
@@ -678,9 +1330,9 @@ Ensure:
 - Generated epics adhere to the INVEST criteria: Independent, Negotiable, Valuable, Estimable, Small, and Testable.
 
 Example Output format (JSON only):
-{{
+{
     "epics": [
-        {{
+        {
             "title": "User Authentication and Authorization",
             "description": "Allow users to securely sign up, login, and manage their credentials.",
             "business_value": "Improves security and user trust by safeguarding account access.",
@@ -693,78 +1345,16 @@ Example Output format (JSON only):
             "dependencies": ["User Registration Epic"],
             "assumptions": ["Email service is reliable"],
             "risks": ["Potential phishing attacks"]
-        }}
+        }
     ]
-}}
+}
 Reply ONLY with the JSON object.
 """
-        
-        try:
-            response = await self._call_openai(epic_prompt)
-            epic_data = self._parse_json_response(response)
-            epics = epic_data.get('epics', [])
-            logger.info(f"Generated {len(epics)} epics")
-            return epics
-        except Exception as e:
-            logger.error(f"Error generating epics: {e}")
-            return []
-    
-    def _build_qa_context(self, qa_responses: Dict[str, str]) -> str:
-        if not qa_responses:
-            return "No Q&A responses provided"
-        
-        context_parts = []
-        for question_id, response in qa_responses.items():
-            if response and response != "[SKIPPED]":
-                context_parts.append(f"- {response}")
-        
-        return "\n".join(context_parts) if context_parts else "No valid responses"
-    
-    async def _call_openai(self, prompt: str) -> str:
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert Epic writer. Respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=3000
-            )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
-            raise
-    
-    def _parse_json_response(self, response: str) -> Dict[str, Any]:
-        try:
-            cleaned_response = re.sub(r'```json\n?|\n?```', '', response.strip())
-            return json.loads(cleaned_response)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {e}")
-            raise ValueError(f"Failed to parse JSON: {e}")
 
-class UserStoryGeneratorAgent:
-    def __init__(self, openai_client: OpenAI):
-        self.client = openai_client
-        self.model = "gpt-4"
-        self.temperature = 0.3
-        logger.info("User Story Generator Agent initialized")
-    
-    async def generate_user_stories(self, hlr: str, context: str, qa_responses: Dict[str, str], epics: List[Dict]) -> List[Dict]:
-        qa_context = self._build_qa_context(qa_responses)
-        epic_context = self._build_epic_context(epics)
-        
-        story_prompt = f"""
+_STORY_INSTRUCTIONS = """
 ### Role
 You are an expert User Story writer for JIRA with deep knowledge in Agile and enterprise scaled frameworks.
 
-### Context
-- High-Level Requirement (HLR): "{hlr}"
-- Additional Context: {context}
-- Q&A Insights: {qa_context}
-- Related Epics: {epic_context}
-
 ### Task
 Generate 5 to 12 detailed user stories fully decomposing the HLR and aligned with related epics.
 
@@ -786,9 +1376,9 @@ Ensure:
 - JSON output is syntactically valid and parsable.
 
 Example JSON Output format:
-{{
+{
     "user_stories": [
-        {{
+        {
             "title": "User can log in with email and password",
             "description": "As a registered user, I want to log in using email and password so that I can access my dashboard",
             "user_persona": "Registered User",
@@ -806,115 +1396,208 @@ Example JSON Output format:
             "labels": ["authentication", "frontend"],
             "dependencies": ["Database setup"],
             "epic_reference": "Related Epic Title or null"
-        }}
+        }
     ]
-}}
+}
 
-Reply ONLY with the JSON object. 
+Reply ONLY with the JSON object.
 """
+
+class EpicGeneratorAgent:
+    def __init__(self, openai_client: Optional["AsyncOpenAI"] = None):
+        self._client = openai_client
+        self.model = "gpt-4o"
+        self.temperature = 0.3
+        self.max_tokens = 2000
+        logger.info("Epic Generator Agent initialized")
+    
+    @property
+    def client(self) -> "AsyncOpenAI":
+        return self._client or get_openai_client()
+    
+    @semantic_cache("epics", exact_hlr=True)
+    async def generate_epics(self, hlr: str, context: str, qa_responses: Dict[str, str],
+                             queue: Optional[asyncio.Queue] = None) -> List[Dict]:
+        epic_prompt = self._build_prompt(hlr, context, qa_responses)
         
         try:
-            response = await self._call_openai(story_prompt)
-            story_data = self._parse_json_response(response)
+            response = await self._call_openai(epic_prompt, queue)
+            epic_data = parse_json_response(response)
+            epics = epic_data.get('epics', [])
+            logger.info("Generated %s epics", len(epics))
+            return epics
+        except Exception as e:
+            logger.error("Error generating epics: %s", e)
+            return []
+    
+    def batch_request(self, hlr: str, context: str, qa_responses: Dict[str, str]) -> Tuple[str, str, str, float, int]:
+        """The completion generate_epics would make, in the form batch_completions takes"""
+        return (self.model, _EPIC_INSTRUCTIONS, self._build_prompt(hlr, context, qa_responses), self.temperature, self.max_tokens)
+    
+    def _build_prompt(self, hlr: str, context: str, qa_responses: Dict[str, str]) -> str:
+        qa_context = self._build_qa_context(qa_responses)
+        
+        return f"""
+## Context
+- High-Level Requirement (HLR): "{hlr}"
+- Q&A Insights: {qa_context}
+- Additional Context: {context}
+
+"""
+    
+    def _build_qa_context(self, qa_responses: Dict[str, str]) -> str:
+        if not qa_responses:
+            return "No Q&A responses provided"
+        
+        # dict.fromkeys drops repeated answers while keeping their order
+        answers = dict.fromkeys(
+            response.strip() for response in qa_responses.values()
+            if response and response != "[SKIPPED]"
+        )
+        context_parts = [f"- {answer}" for answer in answers if answer]
+        
+        return "\n".join(context_parts)[:MAX_CTX_CHARS] if context_parts else "No valid responses"
+    
+    async def _call_openai(self, prompt: str, queue: Optional[asyncio.Queue] = None) -> str:
+        """Call the model, streaming when a queue is given so each epic reaches it as soon as it completes"""
+        system = _EPIC_INSTRUCTIONS
+        try:
+            return await cached_completion(self.client, self.model, system, prompt, self.temperature, self.max_tokens, "epics", queue, persist=False)
+        except Exception as e:
+            logger.error("OpenAI API error: %s", e)
+            raise
+
+class UserStoryGeneratorAgent:
+    def __init__(self, openai_client: Optional["AsyncOpenAI"] = None):
+        self._client = openai_client
+        self.model = "gpt-4o"
+        self.temperature = 0.3
+        self.max_tokens = 4000
+        logger.info("User Story Generator Agent initialized")
+    
+    @property
+    def client(self) -> "AsyncOpenAI":
+        return self._client or get_openai_client()
+    
+    @semantic_cache("user_stories", exact_hlr=True)
+    async def generate_user_stories(self, hlr: str, context: str, qa_responses: Dict[str, str], epics: List[Dict],
+                                    queue: Optional[asyncio.Queue] = None) -> List[Dict]:
+        story_prompt = self._build_prompt(hlr, context, qa_responses, epics)
+        
+        try:
+            response = await self._call_openai(story_prompt, queue)
+            story_data = parse_json_response(response)
             stories = story_data.get('user_stories', [])
-            logger.info(f"Generated {len(stories)} user stories")
+            logger.info("Generated %s user stories", len(stories))
             return stories
         except Exception as e:
-            logger.error(f"Error generating user stories: {e}")
+            logger.error("Error generating user stories: %s", e)
             return []
     
+    def batch_request(self, hlr: str, context: str, qa_responses: Dict[str, str],
+                      epics: List[Dict]) -> Tuple[str, str, str, float, int]:
+        """The completion generate_user_stories would make, in the form batch_completions takes"""
+        return (self.model, _STORY_INSTRUCTIONS, self._build_prompt(hlr, context, qa_responses, epics), self.temperature, self.max_tokens)
+    
+    def _build_prompt(self, hlr: str, context: str, qa_responses: Dict[str, str], epics: List[Dict]) -> str:
+        qa_context = self._build_qa_context(qa_responses)
+        epic_context = self._build_epic_context(epics)
+        
+        return f"""
+### Context
+- High-Level Requirement (HLR): "{hlr}"
+- Q&A Insights: {qa_context}
+- Related Epics: {epic_context}
+- Additional Context: {context}
+
+"""
+    
     def _build_qa_context(self, qa_responses: Dict[str, str]) -> str:
         if not qa_responses:
             return "No Q&A responses provided"
         
-        context_parts = []
-        for question_id, response in qa_responses.items():
-            if response and response != "[SKIPPED]":
-                context_parts.append(f"- {response}")
+        # dict.fromkeys drops repeated answers while keeping their order
+        answers = dict.fromkeys(
+            response.strip() for response in qa_responses.values()
+            if response and response != "[SKIPPED]"
+        )
+        context_parts = [f"- {answer}" for answer in answers if answer]
         
-        return "\n".join(context_parts) if context_parts else "No valid responses"
+        return "\n".join(context_parts)[:MAX_CTX_CHARS] if context_parts else "No valid responses"
     
     def _build_epic_context(self, epics: List[Dict]) -> str:
         if not epics:
             return "No epics available"
         
+        # Keep the prompt bounded: only the highest-priority epics, with short descriptions
+        top_epics = sorted(epics, key=lambda epic: _PRIORITY_RANK.get(str(epic.get('priority', '')).lower(), len(_PRIORITY_RANK)))
         context_parts = []
-        for epic in epics:
-            context_parts.append(f"- {epic.get('title', 'Untitled')}: {epic.get('description', 'No description')}")
+        for epic in top_epics[:MAX_CONTEXT_EPICS]:
+            description = epic.get('description') or 'No description'
+            context_parts.append(f"- {epic.get('title', 'Untitled')}: {description[:MAX_EPIC_DESC_CHARS]}")
         
-        return "\n".join(context_parts)
+        return "\n".join(context_parts)[:MAX_CTX_CHARS]
     
-    async def _call_openai(self, prompt: str) -> str:
+    async def _call_openai(self, prompt: str, queue: Optional[asyncio.Queue] = None) -> str:
+        """Call the model, streaming when a queue is given so each user story reaches it as soon as it completes"""
+        system = _STORY_INSTRUCTIONS
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert User Story writer. Respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=4000
-            )
-            return response.choices[0].message.content.strip()
+            return await cached_completion(self.client, self.model, system, prompt, self.temperature, self.max_tokens, "user_stories", queue, persist=False)
         except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
+            logger.error("OpenAI API error: %s", e)
             raise
-    
-    def _parse_json_response(self, response: str) -> Dict[str, Any]:
-        try:
-            cleaned_response = re.sub(r'```json\n?|\n?```', '', response.strip())
-            return json.loads(cleaned_response)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {e}")
-            raise ValueError(f"Failed to parse JSON: {e}")
 
 # Interactive functions
-def select_project(projects: List[JIRAProject]) -> Optional[str]:
+async def prompt_number(prompt: str, low: int, high: int) -> int:
+    """Prompt until the user enters a whole number between low and high"""
+    while True:
+        choice = (await ainput(prompt)).strip()
+        if choice.isdecimal() and low <= int(choice) <= high:
+            return int(choice)
+
+async def select_project(projects: List[JIRAProject]) -> Optional[str]:
     if not projects:
         return None
     
-    for i, project in enumerate(projects, 1):
-        desc = f" - {project.description}" if project.description else ""
-        print(f"{i}. {project.key}: {project.name}{desc}")
+    print("\n".join(
+        f"{i}. {project.key}: {project.name}" + (f" - {project.description}" if project.description else "")
+        for i, project in enumerate(projects, 1)
+    ))
     
-    while True:
-        try:
-            choice = int(input(f"\nSelect project (1-{len(projects)}): "))
-            if 1 <= choice <= len(projects):
-                return projects[choice - 1].key
-        except ValueError:
-            continue
+    choice = await prompt_number(f"\nSelect project (1-{len(projects)}): ", 1, len(projects))
+    return projects[choice - 1].key
 
-def get_workflow_choice() -> str:
-    while True:
-        choice = input("\nChoose workflow:\n1. Work with existing JIRA issues\n2. Create new requirement\nEnter choice (1/2): ").strip()
-        if choice in ["1", "2"]:
-            return "existing" if choice == "1" else "new"
+async def get_workflow_choice() -> str:
+    choice = await prompt_number("\nChoose workflow:\n1. Work with existing JIRA issues\n2. Create new requirement\nEnter choice (1/2): ", 1, 2)
+    return "existing" if choice == 1 else "new"
 
-def display_all_issues_agentic(jira_integration: JiraAgenticIntegration, project_key: str) -> str:
-    """Agentic display of epics only"""
+async def display_all_issues_agentic(jira_integration: JiraAgenticIntegration, project_key: str) -> Tuple[str, List[JIRAIssue]]:
+    """Agentic display of epics only; also returns the fetched issues for reuse"""
     print(f"\nRetrieving epics from project {project_key}...")
     
-    epics_display = jira_integration.get_all_tasks_agentic(project_key)
+    # The jira client is synchronous; run its calls in worker threads so they overlap and don't block the loop
+    epics_display, issues = await asyncio.gather(
+        asyncio.to_thread(jira_integration.get_all_tasks_agentic, project_key),
+        asyncio.to_thread(jira_integration.get_issues_agentic, project_key),
+    )
     print(epics_display)
     
-    issues = jira_integration.get_issues_agentic(project_key)
-    
-    # Filter only epics
-    epics_detail = []
-    for issue in issues:
-        if issue.issue_type.lower() == 'epic':
-            epics_detail.append(f"Epic: {issue.key} - {issue.summary}\nStatus: {issue.status}\nDescription: {issue.description}")
+    # Epic descriptions come from the (cached) epic query; the issue list carries no descriptions
+    epics = await asyncio.to_thread(jira_integration.get_epics_agentic, project_key)
+    epics_detail = [
+        f"Epic: {epic.key} - {epic.summary}\nStatus: {epic.status}\nDescription: {epic.description}"
+        for epic in epics
+    ]
     
-    return "\n\n".join(epics_detail) if epics_detail else "No epics found in this project"
+    return ("\n\n".join(epics_detail) if epics_detail else "No epics found in this project"), issues
 
-def get_persona_with_suggestion(recommended_persona: str) -> str:
+async def get_persona_with_suggestion(recommended_persona: str) -> str:
     """Get persona with AI suggestion and user confirmation"""
     print(f"\nPersona Selection:")
     print("-" * 30)
     print(f"Suggested persona: {recommended_persona}")
     
-    choice = input(f"Press 'ok' to use suggested persona or enter your preferred persona: ").strip()
+    choice = (await ainput(f"Press 'ok' to use suggested persona or enter your preferred persona: ")).strip()
     
     if choice.lower() in ['ok', 'okay', '']:
         print(f"Using suggested persona: {recommended_persona}")
@@ -924,19 +1607,19 @@ def get_persona_with_suggestion(recommended_persona: str) -> str:
         print(f"Using custom persona: {custom_persona}")
         return custom_persona
 
-def get_hlr_input() -> str:
+async def get_hlr_input() -> str:
     """Get HLR input"""
     print("\nEnter your High-Level Requirement:")
     print("-" * 40)
-    hlr = input().strip()
+    hlr = (await ainput()).strip()
     
     if not hlr:
         print("Please enter your requirement:")
-        hlr = input().strip()
+        hlr = (await ainput()).strip()
     
     return hlr
 
-def get_additional_inputs() -> str:
+async def get_additional_inputs() -> str:
     """Get additional inputs from user before analysis"""
     print("\n" + "="*60)
     print("ADDITIONAL INPUTS")
@@ -946,80 +1629,318 @@ def get_additional_inputs() -> str:
     print("\nPress Enter to skip, or type your inputs:")
     print("-" * 60)
     
-    additional_inputs = input().strip()
+    additional_inputs = (await ainput()).strip()
     
     if additional_inputs:
         print(f"\nAdditional inputs captured: {len(additional_inputs)} characters")
-        logger.info(f"User provided additional inputs: {additional_inputs[:100]}...")
+        logger.info("User provided additional inputs: %s...", additional_inputs[:100])
     else:
         print("\nNo additional inputs provided. Proceeding with HLR only.")
         logger.info("No additional inputs provided by user")
     
     return additional_inputs
 
-def get_generation_type() -> GenerationType:
+async def get_generation_type() -> GenerationType:
     options = {
         "1": GenerationType.EPICS_ONLY,
         "2": GenerationType.STORIES_ONLY,
         "3": GenerationType.BOTH
     }
     
-    print("\n1. Epics Only")
-    print("2. User Stories Only")
-    print("3. Both Epics and User Stories")
+    print("\n1. Epics Only\n2. User Stories Only\n3. Both Epics and User Stories")
     
-    while True:
-        choice = input("\nSelect generation type (1-3): ").strip()
-        if choice in options:
-            return options[choice]
+    choice = await prompt_number("\nSelect generation type (1-3): ", 1, 3)
+    return options[str(choice)]
+
+# Generic refinement generated speculatively while the user reviews content
+PREFETCH_FEEDBACK = "Improve clarity and completeness"
+PREFETCH_SIMILARITY = 0.85
+
+# Set by --batch-feedback: feedback variants are collected up front and regenerated in one Batch API job
+BATCH_FEEDBACK = False
+MAX_FEEDBACK_VARIANTS = 3
 
 # Agents will be initialized in main function to avoid duplicate initialization
 
+async def generate_content(epic_agent: EpicGeneratorAgent, story_agent: UserStoryGeneratorAgent,
+                           state: WorkflowState, context: str, regenerate: bool = False,
+                           queue: Optional[asyncio.Queue] = None, keep_epics: bool = False):
+    """Generate the requested epics and stories, issuing both LLM calls concurrently; keep_epics leaves existing epics as they are"""
+    generation_type = state["generation_type"]
+    set_cache_scope(state.get("selected_project"))
+    tasks = {}
+    
+    if generation_type in [GenerationType.EPICS_ONLY, GenerationType.BOTH] and ((regenerate and not keep_epics) or not state.get("epics")):
+        tasks["epics"] = epic_agent.generate_epics(state["hlr"], context, state["responses"], queue=queue)
+    
+    if generation_type in [GenerationType.STORIES_ONLY, GenerationType.BOTH] and (regenerate or not state.get("user_stories")):
+        # Stories reference the epics already in state (the previous iteration when regenerating),
+        # so they do not have to wait for the epic call
+        tasks["user_stories"] = story_agent.generate_user_stories(
+            state["hlr"],
+            context,
+            state["responses"],
+            state.get("epics", []),
+            queue=queue
+        )
+    
+    results = await asyncio.gather(*tasks.values())
+    state.update(zip(tasks, results))
+    
+    # Stories generated alongside fresh epics could not see them; attach each to its closest epic
+    if len(tasks) == 2:
+        await link_stories_to_epics(state["user_stories"], state["epics"])
+
+async def link_stories_to_epics(stories: List[Dict], epics: List[Dict]):
+    """Set each story's epic_reference to the most similar epic title, unless it already names one"""
+    titles = [epic.get('title', '') for epic in epics]
+    unlinked = [story for story in stories if story.get('epic_reference') not in titles]
+    if not titles or not unlinked:
+        return
+    
+    try:
+        # One embeddings request covers both sides; far cheaper than another completion
+        vectors = await embed_texts(get_openai_client(), [
+            *(f"{epic.get('title', '')}\n{epic.get('description', '')}" for epic in epics),
+            *(f"{story.get('title', '')}\n{story.get('description', '')}" for story in unlinked),
+        ])
+        best = (vectors[len(epics):] @ vectors[:len(epics)].T).argmax(axis=1)
+        for story, index in zip(unlinked, best):
+            story['epic_reference'] = titles[index]
+    except Exception as e:
+        logger.error("Error linking stories to epics: %s", e)
+
+async def generate_feedback_variants(epic_agent: EpicGeneratorAgent, story_agent: UserStoryGeneratorAgent,
+                                     state: WorkflowState, base_context: str, variants: List[str]) -> List[Dict[str, List[Dict]]]:
+    """Regenerate the content once per feedback variant, submitting every request in a single batch"""
+    generation_type = state["generation_type"]
+    requests, slots = [], []
+    
+    for i, feedback in enumerate(variants):
+        context = f"{base_context}\n\nUser Feedback: {feedback}\nIteration: {state['feedback_count'] + 1}"
+        if generation_type in [GenerationType.EPICS_ONLY, GenerationType.BOTH]:
+            requests.append(epic_agent.batch_request(state["hlr"], context, state["responses"]))
+            slots.append((i, "epics"))
+        if generation_type in [GenerationType.STORIES_ONLY, GenerationType.BOTH]:
+            requests.append(story_agent.batch_request(state["hlr"], context, state["responses"], state.get("epics", [])))
+            slots.append((i, "user_stories"))
+    
+    results = [{} for _ in variants]
+    for (i, key), content in zip(slots, await batch_completions(get_openai_client(), requests)):
+        try:
+            results[i][key] = parse_json_response(content).get(key, []) if content else []
+        except ValueError:
+            results[i][key] = []
+    
+    if generation_type == GenerationType.BOTH:
+        await asyncio.gather(*(link_stories_to_epics(result["user_stories"], result["epics"]) for result in results))
+    return results
+
+async def apply_batch_feedback(epic_agent: EpicGeneratorAgent, story_agent: UserStoryGeneratorAgent,
+                               state: WorkflowState, base_context: str):
+    """Collect several feedback variants, regenerate them all as one batch job and keep the one the user picks"""
+    print(f"\nEnter up to {MAX_FEEDBACK_VARIANTS} feedback variants, one per line (empty line to finish):")
+    variants = []
+    while len(variants) < MAX_FEEDBACK_VARIANTS:
+        feedback = (await ainput(f"Variant {len(variants) + 1}: ")).strip()
+        if not feedback:
+            break
+        variants.append(feedback)
+    if not variants:
+        return
+    
+    print(f"\nSubmitted {len(variants)} variants as a batch job; this may take several minutes...")
+    try:
+        results = await generate_feedback_variants(epic_agent, story_agent, state, base_context, variants)
+    except Exception as e:
+        logger.error("Batch feedback failed: %s", e)
+        print(f"❌ Batch feedback failed: {e}")
+        return
+    
+    lines = []
+    for i, (feedback, result) in enumerate(zip(variants, results), 1):
+        lines.append(f"\nVARIANT {i}: {feedback}")
+        for key, label in (("epics", "Epics"), ("user_stories", "Stories")):
+            if key in result:
+                lines.append(f"  {label} ({len(result[key])}):")
+                lines.extend(f"    - {item.get('title', 'Untitled')}" for item in result[key])
+    print("\n".join(lines))
+    
+    choice = await prompt_number(f"\nKeep which variant? (0 keeps the current content, 1-{len(variants)}): ", 0, len(variants))
+    if choice:
+        state.update(results[choice - 1])
+        state["feedback_history"].append(variants[choice - 1])
+        state["feedback_count"] += 1
+        checkpoint(state)
+
+async def feedback_matches_prefetch(feedback: str) -> bool:
+    """Whether the user's feedback asks for roughly what the speculative refinement already did"""
+    try:
+        client = get_openai_client()
+        generic, actual = await asyncio.gather(embed_text(client, PREFETCH_FEEDBACK), embed_text(client, feedback))
+        return float(generic @ actual) >= PREFETCH_SIMILARITY
+    except Exception as e:
+        logger.error("Error comparing feedback with the prefetched refinement: %s", e)
+        return False
+
+async def generate_content_streaming(epic_agent: EpicGeneratorAgent, story_agent: UserStoryGeneratorAgent,
+                                     state: WorkflowState, context: str, regenerate: bool = False,
+                                     keep_epics: bool = False):
+    """Run generate_content for the CLI, printing each item's title as it streams in; Ctrl+C stops generation"""
+    queue = asyncio.Queue()
+    
+    async def print_titles():
+        while True:
+            item = await queue.get()
+            print(f"  + {item.get('title', 'Untitled')}", flush=True)
+            queue.task_done()
+    
+    print("\nGenerating (Ctrl+C to stop)...")
+    task = asyncio.create_task(generate_content(epic_agent, story_agent, state, context, regenerate, queue, keep_epics))
+    printer = asyncio.create_task(print_titles())
+    
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, task.cancel)
+        handles_sigint = True
+    except (NotImplementedError, RuntimeError):
+        handles_sigint = False
+    
+    try:
+        # asyncio.wait leaves the task's cancellation to the signal handler rather than ours
+        await asyncio.wait({task})
+        if task.cancelled():
+            print("\nGeneration stopped; keeping the previous content")
+        else:
+            task.result()
+            await queue.join()
+    finally:
+        if handles_sigint:
+            loop.remove_signal_handler(signal.SIGINT)
+        task.cancel()
+        printer.cancel()
+
+# Last serialized value of every state field, per session, so progress lines carry only changes
+_progress_snapshots: Dict[str, Dict[str, bytes]] = {}
+
+def append_progress(state: WorkflowState):
+    """Append the fields changed since the previous checkpoint to the session's JSONL progress log"""
+    session_id = state.get("session_id")
+    if not session_id:
+        return
+    
+    try:
+        snapshot = _progress_snapshots.setdefault(session_id, {})
+        delta = []
+        for key, value in state.items():
+            encoded = orjson.dumps(value, default=str)
+            if snapshot.get(key) != encoded:
+                snapshot[key] = encoded
+                delta.append(orjson.dumps(key) + b":" + encoded)
+        if not delta:
+            return
+        
+        # Changed fields are spliced in already encoded rather than serialized a second time
+        header = orjson.dumps({"step": state.get("current_step", ""), "ts": time.time()})
+        line = header[:-1] + b',"delta":{' + b",".join(delta) + b"}}\n"
+        with open(_progress_path(session_id), "ab") as f:
+            f.write(line)
+    except Exception as e:
+        logger.error("Error appending progress: %s", e)
+
+def _progress_path(session_id: str) -> str:
+    """JSONL progress log of one session, in the working directory"""
+    return f"jira_progress_{session_id}.jsonl"
+
+def discard_progress(state: WorkflowState):
+    """Remove a finished session's progress log; the history database keeps its final checkpoint"""
+    session_id = state.get("session_id")
+    if not session_id:
+        return
+    
+    _progress_snapshots.pop(session_id, None)
+    try:
+        os.remove(_progress_path(session_id))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error("Error removing progress log: %s", e)
+
+def checkpoint(state: WorkflowState):
+    """Save the session to history and append its changes to the progress log"""
+    history_manager.save_checkpoint(state)
+    append_progress(state)
+
+# Sessions whose answers validated at least this well are offered for reuse on similar HLRs
+QA_REUSE_MIN_CONFIDENCE = 0.8
+_QA_SESSION_FIELDS = ("persona", "slicing_type", "requirement_analysis", "questions",
+                      "responses", "validation_results", "overall_confidence")
+
+async def reuse_previous_qa(state: WorkflowState) -> bool:
+    """Offer the analysis and answers of a similar earlier session; True when the user accepts them"""
+    cached = await recall(get_openai_client(), "qa_session", state["hlr"], [state.get("additional_inputs", "")])
+    if not cached:
+        return False
+    
+    print("\nA very similar requirement was analyzed and answered in an earlier session.")
+    print(f"Persona: {cached['persona']} | Slicing Type: {cached['slicing_type']} | Answers: {len(cached['responses'])}")
+    choice = (await ainput("Reuse its analysis and answers and skip the Q&A? (y/n): ")).strip().lower()
+    if choice not in ['y', 'yes']:
+        return False
+    
+    state.update(cached)
+    state["questions"] = [Question(**question) for question in cached["questions"]]
+    state["validation_results"] = {
+        question_id: ValidationResult(**result) for question_id, result in cached["validation_results"].items()
+    }
+    logger.info("Reused Q&A from a previous session for HLR: %s", state["hlr"][:100])
+    return True
+
 # Node functions
 async def start_node(state: WorkflowState) -> WorkflowState:
     # If resuming, skip initialization
     if state.get("is_resumed"):
-        logger.info(f"Resuming session {state['session_id']}")
+        logger.info("Resuming session %s", state['session_id'])
         return state
     
-    state["session_id"] = f"session_{uuid.uuid4().hex[:8]}"
+    state["session_id"] = f"session_{token_hex(4)}"
     state["current_step"] = "start"
     state["phase"] = AnalysisPhase.INPUT
     state["has_jira_access"] = True
     state["is_resumed"] = False
     
     # Save checkpoint
-    history_manager.save_checkpoint(state)
+    checkpoint(state)
     
     # Select project first
     print("\nAvailable Projects:")
     print("-" * 40)
-    projects = jira_agent.get_projects_agentic()
+    projects = await asyncio.to_thread(jira_agent.get_projects_agentic)
     
     if not projects:
         print("No accessible JIRA projects found")
         state["errors"].append("No accessible JIRA projects found")
         state["has_jira_access"] = False
         state["workflow_type"] = "new"
-        history_manager.save_checkpoint(state)
+        checkpoint(state)
         return state
     
-    selected_project_key = select_project(projects)
+    selected_project_key = await select_project(projects)
     if not selected_project_key:
         print("No project selected")
         state["errors"].append("No project selected")
         state["has_jira_access"] = False
         state["workflow_type"] = "new"
-        history_manager.save_checkpoint(state)
+        checkpoint(state)
         return state
     
     state["selected_project"] = selected_project_key
     
     # Now ask workflow choice
-    state["workflow_type"] = get_workflow_choice()
+    state["workflow_type"] = await get_workflow_choice()
     
     # Save checkpoint after workflow choice
-    history_manager.save_checkpoint(state)
+    checkpoint(state)
     
     return state
 
@@ -1027,22 +1948,20 @@ async def jira_integration_node(state: WorkflowState) -> WorkflowState:
     state["current_step"] = "jira_integration"
     
     # Display all issues
-    issues_detail = display_all_issues_agentic(jira_agent, state["selected_project"])
+    issues_detail, issues = await display_all_issues_agentic(jira_agent, state["selected_project"])
     state["issues_detail"] = issues_detail
-    
-    issues = jira_agent.get_issues_agentic(state["selected_project"])
     state["selected_issues"] = [issue.key for issue in issues]
     
     # Get HLR after displaying issues (skip if already provided in resumed session)
     if not state.get("hlr"):
-        state["hlr"] = get_hlr_input()
+        state["hlr"] = await get_hlr_input()
     
     # Get additional inputs before starting analysis (skip if already provided)
     if not state.get("additional_inputs"):
-        state["additional_inputs"] = get_additional_inputs()
+        state["additional_inputs"] = await get_additional_inputs()
     
     # Save checkpoint
-    history_manager.save_checkpoint(state)
+    checkpoint(state)
     
     return state
 
@@ -1051,16 +1970,16 @@ async def new_requirement_node(state: WorkflowState) -> WorkflowState:
     
     # Skip input if already provided in resumed session
     if not state.get("hlr"):
-        state["hlr"] = get_hlr_input()
+        state["hlr"] = await get_hlr_input()
     
     # Get additional inputs before starting analysis (skip if already provided)
     if not state.get("additional_inputs"):
-        state["additional_inputs"] = get_additional_inputs()
+        state["additional_inputs"] = await get_additional_inputs()
     
     state["has_jira_access"] = False
     
     # Save checkpoint
-    history_manager.save_checkpoint(state)
+    checkpoint(state)
     
     return state
 
@@ -1072,25 +1991,38 @@ async def analyze_requirements_node(state: WorkflowState) -> WorkflowState:
         state["errors"].append("No HLR provided")
         return state
     
+    set_cache_scope(state.get("selected_project"))
+    
+    # Fast path: reuse a near-identical earlier session's analysis and answers instead of repeating the Q&A
+    if not state.get("questions") and await reuse_previous_qa(state):
+        checkpoint(state)
+        return state
+    
     # Generate JIRA guidance if working with existing project
     jira_guidance = ""
     if state.get("workflow_type") == "existing" and state.get("has_jira_access") and state.get("selected_issues"):
         selected_project = state.get("selected_project")
         if selected_project:
-            issues = jira_agent.get_issues_agentic(selected_project)
-            jira_guidance = jira_agent.generate_context_guidance(issues, state["hlr"])
+            issues = await asyncio.to_thread(jira_agent.get_issues_agentic, selected_project)
+            related = await jira_agent.find_related_issues(selected_project, issues, state["hlr"])
+            jira_guidance = jira_agent.generate_context_guidance(issues, state["hlr"], related)
     
     # Analyze requirement with JIRA context and additional inputs (skip if already analyzed)
     if not state.get("requirement_analysis"):
         additional_inputs = state.get("additional_inputs", "")
-        analysis = await req_agent.analyze_requirement(state["hlr"], additional_inputs, jira_guidance)
+        # One call returns the analysis plus questions drafted for the recommended persona
+        analysis, questions = await req_agent.analyze_and_question(state["hlr"], additional_inputs, jira_guidance)
         state["requirement_analysis"] = analysis
         state["slicing_type"] = analysis.get("slicing_type", "functional")
+        recommended_persona = analysis.get("recommended_persona", "Business Analyst")
         
         # Get persona with AI suggestion (skip if already set)
         if not state.get("persona"):
-            recommended_persona = analysis.get("recommended_persona", "Business Analyst")
-            state["persona"] = get_persona_with_suggestion(recommended_persona)
+            state["persona"] = await get_persona_with_suggestion(recommended_persona)
+        
+        # The drafted questions only fit if the user kept the recommended persona
+        if not state.get("questions") and state["persona"] == recommended_persona:
+            state["questions"] = questions
     
     # Generate questions with JIRA context and additional inputs (skip if already generated)
     state["phase"] = AnalysisPhase.QUESTIONING
@@ -1100,10 +2032,13 @@ async def analyze_requirements_node(state: WorkflowState) -> WorkflowState:
         state["questions"] = questions
     
     # Save checkpoint before Q&A
-    history_manager.save_checkpoint(state)
+    checkpoint(state)
     
     # Interactive Q&A session (skip already answered questions)
     qa_responses = state.get("responses", {})
+    answered = []
+    # Each answer is validated in the background while the user reads and answers the next question
+    pending: List[asyncio.Task] = []
     
     for question in state["questions"]:
         # Skip if already answered
@@ -1114,23 +2049,30 @@ async def analyze_requirements_node(state: WorkflowState) -> WorkflowState:
         print(f"Context: {question.context}")
         print(f"Priority: {question.priority}/5 | Required: {'Yes' if question.required else 'No'}")
         
-        response = input("Your answer (or 'skip' to skip): ").strip()
+        response = (await ainput("Your answer (or 'skip' to skip): ")).strip()
         
         if response.lower() == 'skip':
             question.skipped = True
             question.answered = True
             question.answer = "[SKIPPED]"
         elif response:
-            # Validate response
-            state["phase"] = AnalysisPhase.VALIDATING
-            validation_result = await req_agent.validate_response(state["hlr"], question, response)
-            
             question.answered = True
             question.answer = response
             qa_responses[question.id] = response
+            answered.append(question)
+            pending.append(asyncio.create_task(req_agent.validate_response(state["hlr"], question, response)))
+    
+    # Most validations finished during think-time; only the last answer's is usually still in flight
+    if answered:
+        state["phase"] = AnalysisPhase.VALIDATING
+        validation_results = await asyncio.gather(*pending)
+        improved = []
+        
+        for question, validation_result in zip(answered, validation_results):
             state["validation_results"][question.id] = validation_result
             
             if not validation_result.is_valid and validation_result.issues:
+                print(f"\nQuestion: {question.question}")
                 print("Issues found:")
                 for issue in validation_result.issues:
                     print(f"- {issue}")
@@ -1140,21 +2082,34 @@ async def analyze_requirements_node(state: WorkflowState) -> WorkflowState:
                     for suggestion in validation_result.suggestions:
                         print(f"- {suggestion}")
                 
-                retry = input("Provide better answer? (y/n): ").strip().lower()
+                retry = (await ainput("Provide better answer? (y/n): ")).strip().lower()
                 if retry == 'y':
-                    new_response = input("Your improved answer: ").strip()
+                    new_response = (await ainput("Your improved answer: ")).strip()
                     if new_response:
                         question.answer = new_response
                         qa_responses[question.id] = new_response
+                        improved.append(question)
+        
+        # Re-check every improved answer together so confidence reflects what was finally given
+        if improved:
+            revalidated = await req_agent.validate_responses_batch(
+                state["hlr"], [(question, question.answer) for question in improved]
+            )
+            for question, validation_result in zip(improved, revalidated):
+                state["validation_results"][question.id] = validation_result
     
     state["responses"] = qa_responses
     
     # Calculate overall confidence
-    valid_scores = [vr.overall_score for vr in state["validation_results"].values() if vr.is_valid]
-    state["overall_confidence"] = sum(valid_scores) / len(valid_scores) if valid_scores else 0.0
+    valid_scores = np.fromiter((vr.overall_score for vr in state["validation_results"].values() if vr.is_valid), dtype=np.float64)
+    state["overall_confidence"] = float(valid_scores.mean()) if valid_scores.size else 0.0
+    
+    if qa_responses and state["overall_confidence"] >= QA_REUSE_MIN_CONFIDENCE:
+        await remember(get_openai_client(), "qa_session", state["hlr"],
+                       {field: state.get(field) for field in _QA_SESSION_FIELDS}, [state.get("additional_inputs", "")])
     
     # Save checkpoint after Q&A
-    history_manager.save_checkpoint(state)
+    checkpoint(state)
     
     return state
 
@@ -1163,10 +2118,10 @@ async def setup_generation_node(state: WorkflowState) -> WorkflowState:
     
     # Skip if generation type already set
     if not state.get("generation_type"):
-        state["generation_type"] = get_generation_type()
+        state["generation_type"] = await get_generation_type()
     
     # Save checkpoint
-    history_manager.save_checkpoint(state)
+    checkpoint(state)
     
     return state
 
@@ -1174,45 +2129,29 @@ async def generation_node(state: WorkflowState) -> WorkflowState:
     state["current_step"] = "generation"
     state["phase"] = AnalysisPhase.GENERATING
     
+    analysis = state.get('requirement_analysis') or {}
+    
     # Prepare context
-    context = f"Persona: {state.get('persona', 'Business Analyst')}\n"
-    context += f"Slicing Type: {state.get('slicing_type', 'functional')}\n"
-    context += f"Domain: {state.get('requirement_analysis', {}).get('domain', 'general')}\n"
+    context_parts = [
+        f"Persona: {state.get('persona', 'Business Analyst')}\n",
+        f"Slicing Type: {state.get('slicing_type', 'functional')}\n",
+        f"Domain: {analysis.get('domain', 'general')}\n",
+    ]
     
     # Add additional inputs to context if available
     if state.get("additional_inputs"):
-        context += f"\nAdditional User Inputs: {state['additional_inputs']}\n"
+        context_parts.append(f"\nAdditional User Inputs: {state['additional_inputs']}\n")
     
     if state.get("issues_detail"):
-        context += f"\nJIRA Issues Context:\n{state['issues_detail']}"
-    
-    # Initialize OpenAI client
-    api_key = os.getenv('OPENAI_API_KEY')
-    if api_key.startswith('"') and api_key.endswith('"'):
-        api_key = api_key[1:-1]
-    openai_client = OpenAI(api_key=api_key)
+        context_parts.append(f"\nJIRA Issues Context:\n{state['issues_detail']}")
     
-    epic_agent = EpicGeneratorAgent(openai_client)
-    story_agent = UserStoryGeneratorAgent(openai_client)
+    context = "".join(context_parts)
     
     # Generate content based on type (skip if already generated)
-    if state["generation_type"] in [GenerationType.EPICS_ONLY, GenerationType.BOTH]:
-        if not state.get("epics"):
-            epics = await epic_agent.generate_epics(state["hlr"], context, state["responses"])
-            state["epics"] = epics
-    
-    if state["generation_type"] in [GenerationType.STORIES_ONLY, GenerationType.BOTH]:
-        if not state.get("user_stories"):
-            stories = await story_agent.generate_user_stories(
-                state["hlr"], 
-                context, 
-                state["responses"], 
-                state.get("epics", [])
-            )
-            state["user_stories"] = stories
+    await generate_content_streaming(epic_agent, story_agent, state, context)
     
     # Save checkpoint after generation
-    history_manager.save_checkpoint(state)
+    checkpoint(state)
     
     return state
 
@@ -1242,57 +2181,59 @@ async def feedback_node(state: WorkflowState) -> WorkflowState:
             print(f"   Priority: {story.get('priority', 'Not set')}")
             print(f"   Story Points: {story.get('story_points', 'Not estimated')}")
     
+    # Regeneration context shared by every feedback iteration
+    context_parts = [
+        f"Persona: {state.get('persona', 'Business Analyst')}\n",
+        f"Slicing Type: {state.get('slicing_type', 'functional')}\n",
+    ]
+    
+    # Include additional inputs in regeneration context
+    if state.get("additional_inputs"):
+        context_parts.append(f"\nAdditional User Inputs: {state['additional_inputs']}\n")
+    
+    if state.get("issues_detail"):
+        context_parts.append(f"\nJIRA Context:\n{state['issues_detail']}")
+    
+    base_context = "".join(context_parts)
+    
+    if BATCH_FEEDBACK:
+        await apply_batch_feedback(epic_agent, story_agent, state, base_context)
+    
     # Feedback loop (max 3 iterations)
     while state["feedback_count"] < 3:
-        satisfied = input("\nSatisfied with content? (yes/no): ").strip().lower()
+        satisfied = (await ainput("\nSatisfied with content? (yes/no): ")).strip().lower()
         
         if satisfied in ['yes', 'y']:
             break
         
-        feedback = input("Provide feedback for improvements: ").strip()
-        if not feedback:
-            break
+        # The user wants changes: speculatively refine the epics with generic feedback while they type theirs
+        prefetch = None
+        if state["generation_type"] in [GenerationType.EPICS_ONLY, GenerationType.BOTH]:
+            prefetch_context = f"{base_context}\n\nUser Feedback: {PREFETCH_FEEDBACK}\nIteration: {state['feedback_count'] + 1}"
+            # The task copies the current context; scope it to the project so its cache entries never land under ""
+            set_cache_scope(state.get("selected_project"))
+            prefetch = asyncio.create_task(epic_agent.generate_epics(state["hlr"], prefetch_context, state["responses"]))
         
-        if feedback:
+        try:
+            feedback = (await ainput("Provide feedback for improvements: ")).strip()
+            if not feedback:
+                break
+            
             state["feedback_history"].append(feedback)
             state["feedback_count"] += 1
-            
-            # Regenerate with feedback
-            base_context = f"Persona: {state.get('persona', 'Business Analyst')}\n"
-            base_context += f"Slicing Type: {state.get('slicing_type', 'functional')}\n"
-            
-            # Include additional inputs in regeneration context
-            if state.get("additional_inputs"):
-                base_context += f"\nAdditional User Inputs: {state['additional_inputs']}\n"
-            
-            if state.get("issues_detail"):
-                base_context += f"\nJIRA Context:\n{state['issues_detail']}"
-            
             feedback_context = f"{base_context}\n\nUser Feedback: {feedback}\nIteration: {state['feedback_count']}"
             
-            api_key = os.getenv('OPENAI_API_KEY')
-            if api_key.startswith('"') and api_key.endswith('"'):
-                api_key = api_key[1:-1]
-            openai_client = OpenAI(api_key=api_key)
-            
-            epic_agent = EpicGeneratorAgent(openai_client)
-            story_agent = UserStoryGeneratorAgent(openai_client)
-            
-            if state["generation_type"] in [GenerationType.EPICS_ONLY, GenerationType.BOTH]:
-                epics = await epic_agent.generate_epics(state["hlr"], feedback_context, state["responses"])
-                state["epics"] = epics
-            
-            if state["generation_type"] in [GenerationType.STORIES_ONLY, GenerationType.BOTH]:
-                stories = await story_agent.generate_user_stories(
-                    state["hlr"], 
-                    feedback_context, 
-                    state["responses"], 
-                    state.get("epics", [])
-                )
-                state["user_stories"] = stories
+            # Reuse the speculative epics when the user asked for much the same; stories always come from the live pass
+            prefetched_epics = await prefetch if prefetch and await feedback_matches_prefetch(feedback) else None
+            if prefetched_epics:
+                state["epics"] = prefetched_epics
+                print("\nApplied the epic refinement prepared while you were typing")
+            await generate_content_streaming(
+                epic_agent, story_agent, state, feedback_context, regenerate=True, keep_epics=bool(prefetched_epics)
+            )
             
             # Save checkpoint after feedback iteration
-            history_manager.save_checkpoint(state)
+            checkpoint(state)
             
             # Show updated content
             print("\n" + "="*80)
@@ -1308,25 +2249,24 @@ async def feedback_node(state: WorkflowState) -> WorkflowState:
                 print(f"\nUPDATED STORIES ({len(state['user_stories'])}):")
                 for i, story in enumerate(state["user_stories"], 1):
                     print(f"{i}. {story.get('title', 'Untitled')}")
-        else:
-            break
+        finally:
+            if prefetch:
+                prefetch.cancel()
     
-    # Save final checkpoint
-    history_manager.save_checkpoint(state)
+    # Mark as completed and save final checkpoint
+    finalize_state(state)
+    checkpoint(state)
+    discard_progress(state)
     
     return state
 
-async def final_validation_node(state: WorkflowState) -> WorkflowState:
+def finalize_state(state: WorkflowState):
+    """Final validation, run at the end of feedback_node rather than as its own graph hop"""
     state["current_step"] = "final_validation"
     state["phase"] = AnalysisPhase.COMPLETE
     
-    if not state.get("epics") and not state.get("user_stories"):
+    if not (state.get("epics") or state.get("user_stories")):
         state["errors"].append("No content generated")
-    
-    # Mark as completed and save final checkpoint
-    history_manager.save_checkpoint(state)
-    
-    return state
 
 # Routing functions
 def should_use_jira(state: WorkflowState) -> str:
@@ -1345,112 +2285,158 @@ def determine_next_step_from_resume(state: WorkflowState) -> str:
         "analyze_requirements": "setup_generation",
         "setup_generation": "generation",
         "generation": "feedback",
-        "feedback": "final_validation",
+        "feedback": "END",
         "final_validation": "END"
     }
     
     return step_routing.get(current_step, "analyze_requirements")
 
-# Create workflow
-workflow = StateGraph(WorkflowState)
-
-# Add nodes
-workflow.add_node("start", start_node)
-workflow.add_node("jira_integration", jira_integration_node)
-workflow.add_node("new_requirement", new_requirement_node)
-workflow.add_node("analyze_requirements", analyze_requirements_node)
-workflow.add_node("setup_generation", setup_generation_node)
-workflow.add_node("generation", generation_node)
-workflow.add_node("feedback", feedback_node)
-workflow.add_node("final_validation", final_validation_node)
-
-# Add edges with conditional routing
-workflow.set_entry_point("start")
-workflow.add_conditional_edges("start", should_use_jira)
-workflow.add_edge("jira_integration", "analyze_requirements")
-workflow.add_edge("new_requirement", "analyze_requirements")
-workflow.add_edge("analyze_requirements", "setup_generation")
-workflow.add_edge("setup_generation", "generation")
-workflow.add_edge("generation", "feedback")
-workflow.add_edge("feedback", "final_validation")
-workflow.add_edge("final_validation", END)
-
-# Compile workflow
-app = workflow.compile()
+@functools.cache
+def _get_app():
+    """Build and compile the workflow graph the first time it is needed"""
+    from langgraph.graph import StateGraph, END
+    
+    workflow = StateGraph(WorkflowState)
+    
+    # Add nodes
+    workflow.add_node("start", start_node)
+    workflow.add_node("jira_integration", jira_integration_node)
+    workflow.add_node("new_requirement", new_requirement_node)
+    workflow.add_node("analyze_requirements", analyze_requirements_node)
+    workflow.add_node("setup_generation", setup_generation_node)
+    workflow.add_node("generation", generation_node)
+    workflow.add_node("feedback", feedback_node)
+    
+    # Add edges with conditional routing
+    workflow.set_entry_point("start")
+    workflow.add_conditional_edges("start", should_use_jira)
+    workflow.add_edge("jira_integration", "analyze_requirements")
+    workflow.add_edge("new_requirement", "analyze_requirements")
+    workflow.add_edge("analyze_requirements", "setup_generation")
+    workflow.add_edge("setup_generation", "generation")
+    workflow.add_edge("generation", "feedback")
+    workflow.add_edge("feedback", END)
+    
+    # checkpoint() already persists state after each step, so LangGraph keeps no snapshots of its own
+    return workflow.compile(checkpointer=None, debug=False)
+
+# One epic or story in the results summary
+_RESULT_ITEM_TEMPLATE = "\n{index}. {title}\n   Priority: {priority}\n   Story Points: {points}"
 
 def display_results(state: WorkflowState):
-    print("\n" + "="*60)
-    print("WORKFLOW RESULTS")
-    print("="*60)
-    
-    session_info = f"""
+    lines = [
+        "\n" + "="*60,
+        "WORKFLOW RESULTS",
+        "="*60,
+        f"""
 Session ID: {state['session_id']}
 Workflow Type: {state['workflow_type']}
 Persona: {state.get('persona', 'Not set')}
 Slicing Type: {state.get('slicing_type', 'Not set')}
-Generation Type: {state.get('generation_type', {}).value if state.get('generation_type') else 'Not set'}
+Generation Type: {getattr(state.get('generation_type'), 'value', state.get('generation_type')) or 'Not set'}
 Overall Confidence: {state.get('overall_confidence', 0.0):.2f}
 Feedback Iterations: {state.get('feedback_count', 0)}
 """
-    print(session_info)
+    ]
     
     if state.get('selected_project'):
-        print(f"JIRA Project: {state['selected_project']}")
-        print(f"Issues Analyzed: {len(state.get('selected_issues', []))}")
+        lines.append(f"JIRA Project: {state['selected_project']}")
+        lines.append(f"Issues Analyzed: {len(state.get('selected_issues', []))}")
     
-    print(f"\nHigh Level Requirement:")
-    print("-" * 30)
-    print(state.get('hlr', 'Not provided'))
+    lines += [f"\nHigh Level Requirement:", "-" * 30, state.get('hlr', 'Not provided')]
     
     if state.get('additional_inputs'):
-        print(f"\nAdditional Inputs:")
-        print("-" * 30)
-        print(state.get('additional_inputs'))
+        lines += [f"\nAdditional Inputs:", "-" * 30, state['additional_inputs']]
     
     if state.get('epics'):
-        print(f"\nGenerated Epics ({len(state['epics'])}):")
-        print("-" * 30)
-        for i, epic in enumerate(state['epics'], 1):
-            print(f"\n{i}. {epic.get('title', 'Untitled')}")
-            print(f"   Priority: {epic.get('priority', 'Not set')}")
-            print(f"   Story Points: {epic.get('estimated_story_points', 'Not estimated')}")
+        lines += [f"\nGenerated Epics ({len(state['epics'])}):", "-" * 30]
+        lines.extend(
+            _RESULT_ITEM_TEMPLATE.format(
+                index=i,
+                title=item.get('title', 'Untitled'),
+                priority=item.get('priority', 'Not set'),
+                points=item.get('estimated_story_points', 'Not estimated')
+            )
+            for i, item in enumerate(state['epics'], 1)
+        )
     
     if state.get('user_stories'):
-        print(f"\nGenerated User Stories ({len(state['user_stories'])}):")
-        print("-" * 30)
-        for i, story in enumerate(state['user_stories'], 1):
-            print(f"\n{i}. {story.get('title', 'Untitled')}")
-            print(f"   Priority: {story.get('priority', 'Not set')}")
-            print(f"   Story Points: {story.get('story_points', 'Not estimated')}")
+        lines += [f"\nGenerated User Stories ({len(state['user_stories'])}):", "-" * 30]
+        lines.extend(
+            _RESULT_ITEM_TEMPLATE.format(
+                index=i,
+                title=item.get('title', 'Untitled'),
+                priority=item.get('priority', 'Not set'),
+                points=item.get('story_points', 'Not estimated')
+            )
+            for i, item in enumerate(state['user_stories'], 1)
+        )
     
     if state.get('errors'):
-        print("\nErrors:")
-        print("-" * 30)
-        for error in state['errors']:
-            print(f"- {error}")
+        lines += ["\nErrors:", "-" * 30]
+        lines.extend(f"- {error}" for error in state['errors'])
+    
+    # One write instead of a print per line
+    print("\n".join(lines))
+
+# Fields kept in the clean output, with the value used when the model left one out
+_EPIC_OUTPUT_FIELDS = {
+    "title": '',
+    "description": '',
+    "business_value": '',
+    "acceptance_criteria": [],
+    "priority": '',
+    "estimated_story_points": 0,
+    "dependencies": [],
+    "assumptions": [],
+    "risks": []
+}
+
+_STORY_OUTPUT_FIELDS = {
+    "title": '',
+    "description": '',
+    "user_persona": '',
+    "acceptance_criteria": [],
+    "definition_of_done": [],
+    "story_points": 0,
+    "priority": '',
+    "labels": [],
+    "dependencies": [],
+    "epic_reference": None
+}
+
+def _sum_points(items: List[Dict], key: str) -> float:
+    """Total a story-point field, counting missing or non-numeric estimates as zero"""
+    points = np.fromiter(
+        (value if isinstance(value, (int, float)) else 0 for value in (item.get(key) for item in items)),
+        dtype=np.float64, count=len(items)
+    )
+    total = float(points.sum())
+    return int(total) if total.is_integer() else total
 
-def create_clean_output(state: WorkflowState) -> Dict[str, Any]:
-    """Create clean output without validation scores"""
+def create_clean_output(state: WorkflowState, include_content: bool = True) -> Dict[str, Any]:
+    """Create clean output without validation scores; generated_content is left empty unless include_content"""
+    analysis = state.get('requirement_analysis') or {}
     
     output = {
         "session_metadata": {
             "session_id": state['session_id'],
             "workflow_type": state['workflow_type'],
-            "generation_type": state.get('generation_type', {}).value if state.get('generation_type') else None,
+            "generation_type": getattr(state.get('generation_type'), 'value', state.get('generation_type')) or None,
             "persona": state.get('persona', ''),
             "slicing_type": state.get('slicing_type', ''),
             "overall_confidence": state.get('overall_confidence', 0.0),
             "feedback_iterations": state.get('feedback_count', 0),
-            "created_at": datetime.now().isoformat()
+            "created_at": datetime.now()
         },
         "requirement": {
             "hlr": state.get('hlr', ''),
             "additional_inputs": state.get('additional_inputs', ''),
             "analysis": {
-                "domain": state.get('requirement_analysis', {}).get('domain', ''),
-                "complexity": state.get('requirement_analysis', {}).get('complexity', ''),
-                "user_types": state.get('requirement_analysis', {}).get('user_types', []),
-                "main_features": state.get('requirement_analysis', {}).get('main_features', [])
+                "domain": analysis.get('domain', ''),
+                "complexity": analysis.get('complexity', ''),
+                "user_types": analysis.get('user_types', []),
+                "main_features": analysis.get('main_features', [])
             }
         }
     }
@@ -1473,52 +2459,32 @@ def create_clean_output(state: WorkflowState) -> Dict[str, Any]:
         
         output["qa_session"] = {
             "total_questions": len(state['questions']),
-            "answered_questions": len([q for q in state['questions'] if q.answered and not q.skipped]),
+            "answered_questions": len(qa_summary),
             "responses": qa_summary
         }
     
+    epics = state.get('epics') or []
+    stories = state.get('user_stories') or []
     generated_content = {}
     
-    if state.get('epics'):
-        generated_content["epics"] = []
-        for epic in state['epics']:
-            clean_epic = {
-                "title": epic.get('title', ''),
-                "description": epic.get('description', ''),
-                "business_value": epic.get('business_value', ''),
-                "acceptance_criteria": epic.get('acceptance_criteria', []),
-                "priority": epic.get('priority', ''),
-                "estimated_story_points": epic.get('estimated_story_points', 0),
-                "dependencies": epic.get('dependencies', []),
-                "assumptions": epic.get('assumptions', []),
-                "risks": epic.get('risks', [])
-            }
-            generated_content["epics"].append(clean_epic)
+    if epics and include_content:
+        generated_content["epics"] = [
+            {field: epic.get(field, default) for field, default in _EPIC_OUTPUT_FIELDS.items()}
+            for epic in epics
+        ]
     
-    if state.get('user_stories'):
-        generated_content["user_stories"] = []
-        for story in state['user_stories']:
-            clean_story = {
-                "title": story.get('title', ''),
-                "description": story.get('description', ''),
-                "user_persona": story.get('user_persona', ''),
-                "acceptance_criteria": story.get('acceptance_criteria', []),
-                "definition_of_done": story.get('definition_of_done', []),
-                "story_points": story.get('story_points', 0),
-                "priority": story.get('priority', ''),
-                "labels": story.get('labels', []),
-                "dependencies": story.get('dependencies', []),
-                "epic_reference": story.get('epic_reference', None)
-            }
-            generated_content["user_stories"].append(clean_story)
+    if stories and include_content:
+        generated_content["user_stories"] = [
+            {field: story.get(field, default) for field, default in _STORY_OUTPUT_FIELDS.items()}
+            for story in stories
+        ]
     
     output["generated_content"] = generated_content
     
     output["statistics"] = {
-        "total_epics": len(state.get('epics', [])),
-        "total_user_stories": len(state.get('user_stories', [])),
-        "total_story_points": sum(epic.get('estimated_story_points', 0) for epic in state.get('epics', [])) + 
-                            sum(story.get('story_points', 0) for story in state.get('user_stories', [])),
+        "total_epics": len(epics),
+        "total_user_stories": len(stories),
+        "total_story_points": _sum_points(epics, 'estimated_story_points') + _sum_points(stories, 'story_points'),
         "errors_count": len(state.get('errors', []))
     }
     
@@ -1530,79 +2496,132 @@ def create_clean_output(state: WorkflowState) -> Dict[str, Any]:
     
     return output
 
+def _indented_json(value: Any, depth: int) -> bytes:
+    """OPT_INDENT_2 JSON for a value nested `depth` levels deep; raw newlines only occur between tokens"""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n" + b"  " * depth)
+
+def save_clean_output(state: WorkflowState) -> str:
+    """Write the clean output to disk, serialising one generated item at a time instead of the whole tree"""
+    output = create_clean_output(state, include_content=False)
+    sections = [
+        (key, items, fields)
+        for key, items, fields in (
+            ("epics", state.get('epics') or [], _EPIC_OUTPUT_FIELDS),
+            ("user_stories", state.get('user_stories') or [], _STORY_OUTPUT_FIELDS),
+        )
+        if items
+    ]
+    
+    filename = f"jira_results_{state['session_id']}.json"
+    with open(filename, 'wb') as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(output.items()):
+            f.write((b"," if i else b"") + b"\n  " + orjson.dumps(key) + b": ")
+            if key != "generated_content" or not sections:
+                f.write(_indented_json(value, 1))
+                continue
+            
+            f.write(b"{")
+            for j, (section, items, fields) in enumerate(sections):
+                f.write((b"," if j else b"") + b"\n    " + orjson.dumps(section) + b": [")
+                for k, item in enumerate(items):
+                    clean = {field: item.get(field, default) for field, default in fields.items()}
+                    f.write((b"," if k else b"") + b"\n      " + _indented_json(clean, 3))
+                f.write(b"\n    ]")
+            f.write(b"\n  }")
+        f.write(b"\n}")
+    return filename
+
 async def run_workflow():
+    # Python 3.12+: tasks that finish without suspending (memo hits) skip a trip through the loop
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     # Initialize agents here to avoid duplicate initialization
-    global jira_agent, req_agent, history_manager
+    global jira_agent, req_agent, epic_agent, story_agent, history_manager
     
     # Initialize singletons (will only create once due to singleton pattern)
     jira_agent = JiraAgenticIntegration()
     req_agent = RequirementAnalysisAgent()
     history_manager = HistoryManager()
     
-    # Show main menu: New workflow or History
-    start_choice = get_workflow_start_choice()
+    # The generators hold no per-run state, so every node shares one of each
+    epic_agent = EpicGeneratorAgent()
+    story_agent = UserStoryGeneratorAgent()
+    
+    # Warm the project list while the user reads the menu; start_node then hits the cache
+    projects_prefetch = asyncio.create_task(asyncio.to_thread(jira_agent.get_projects_agentic))
+    
+    try:
+        # Show main menu: New workflow or History (the history menus read stdin synchronously, so run them in a thread)
+        start_choice = await asyncio.to_thread(get_workflow_start_choice)
     
-    if start_choice == 'history':
-        # Display history and get selected session
-        resumed_state = display_history_menu(history_manager)
+        if start_choice == 'history':
+            # Display history and get selected session
+            resumed_state = await asyncio.to_thread(display_history_menu, history_manager)
         
-        if resumed_state:
-            # Mark as resumed
-            resumed_state["is_resumed"] = True
+            if resumed_state:
+                # Mark as resumed
+                resumed_state["is_resumed"] = True
             
-            print("\n Resuming workflow from saved state...")
-            print(f"Continuing from step: {resumed_state.get('current_step', 'unknown')}")
+                print("\n Resuming workflow from saved state...")
+                print(f"Continuing from step: {resumed_state.get('current_step', 'unknown')}")
             
-            # Determine where to continue from
-            current_step = resumed_state.get('current_step', '')
+                # Determine where to continue from
+                current_step = resumed_state.get('current_step', '')
             
-            # Create a new workflow execution starting from the appropriate node
-            try:
-                # If completed, just show results
-                if current_step == 'final_validation':
-                    display_results(resumed_state)
+                # Create a new workflow execution starting from the appropriate node
+                try:
+                    # If completed, just show results
+                    if current_step == 'final_validation':
+                        display_results(resumed_state)
                     
-                    view_results = input("\nView detailed results? (y/n): ").strip().lower()
-                    if view_results == 'y':
-                        clean_output = create_clean_output(resumed_state)
-                        print("\n" + json.dumps(clean_output, indent=2))
+                        view_results = (await ainput("\nView detailed results? (y/n): ")).strip().lower()
+                        if view_results == 'y':
+                            clean_output = create_clean_output(resumed_state)
+                            print("\n" + orjson.dumps(clean_output, option=orjson.OPT_INDENT_2).decode())
                     
-                    regenerate = input("\nRegenerate content with modifications? (y/n): ").strip().lower()
-                    if regenerate == 'y':
-                        # Go back to generation phase
-                        resumed_state["current_step"] = "generation"
-                        resumed_state["is_resumed"] = False
-                        resumed_state["epics"] = []
-                        resumed_state["user_stories"] = []
+                        regenerate = (await ainput("\nRegenerate content with modifications? (y/n): ")).strip().lower()
+                        if regenerate == 'y':
+                            # Go back to generation phase
+                            resumed_state["current_step"] = "generation"
+                            resumed_state["is_resumed"] = False
+                            resumed_state["epics"] = []
+                            resumed_state["user_stories"] = []
                         
-                        final_state = await app.ainvoke(resumed_state)
-                        display_results(final_state)
+                            final_state = await _get_app().ainvoke(resumed_state)
+                            display_results(final_state)
+                        else:
+                            return resumed_state
                     else:
-                        return resumed_state
-                else:
-                    # Continue workflow from current state
-                    final_state = await app.ainvoke(resumed_state)
-                    display_results(final_state)
+                        # Continue workflow from current state
+                        final_state = await _get_app().ainvoke(resumed_state)
+                        display_results(final_state)
                     
-                    save_option = input("\nSave results to file? (y/n): ").strip().lower()
-                    if save_option == 'y':
-                        clean_output = create_clean_output(final_state)
-                        filename = f"jira_results_{final_state['session_id']}.json"
-                        with open(filename, 'w', encoding='utf-8') as f:
-                            json.dump(clean_output, f, indent=2, ensure_ascii=False)
-                        print(f"✓ Results saved to {filename}")
+                        save_option = (await ainput("\nSave results to file? (y/n): ")).strip().lower()
+                        if save_option == 'y':
+                            filename = save_clean_output(final_state)
+                            print(f"✓ Results saved to {filename}")
                     
-                    return final_state
+                        return final_state
                     
-            except Exception as e:
-                logger.error(f"Error resuming workflow: {e}")
-                print(f"❌ Error resuming workflow: {e}")
-                raise
-        else:
-            # User chose to start new workflow from history menu
-            print("\n Starting new workflow...")
+                except Exception as e:
+                    logger.error("Error resuming workflow: %s", e)
+                    print(f"❌ Error resuming workflow: {e}")
+                    raise
+            else:
+                # User chose to start new workflow from history menu
+                print("\n Starting new workflow...")
+    
+        # Start new workflow; let the prefetch finish so start_node doesn't issue the same JIRA request again
+        await projects_prefetch
+    finally:
+        # Resuming from history returns without the prefetch; cancel it so it is never left unretrieved
+        if not projects_prefetch.done():
+            projects_prefetch.cancel()
+        elif not projects_prefetch.cancelled():
+            projects_prefetch.exception()
     
-    # Start new workflow
     initial_state = {
         "session_id": "",
         "workflow_type": "",
@@ -1631,24 +2650,32 @@ async def run_workflow():
     }
     
     try:
-        final_state = await app.ainvoke(initial_state)
+        final_state = await _get_app().ainvoke(initial_state)
         display_results(final_state)
         
-        clean_output = create_clean_output(final_state)
-        
-        save_option = input("\nSave results to file? (y/n): ").strip().lower()
+        save_option = (await ainput("\nSave results to file? (y/n): ")).strip().lower()
         if save_option == 'y':
-            filename = f"jira_results_{final_state['session_id']}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(clean_output, f, indent=2, ensure_ascii=False)
+            filename = save_clean_output(final_state)
             print(f"✓ Results saved to {filename}")
         
         return final_state
         
     except Exception as e:
-        logger.error(f"Workflow error: {e}")
+        logger.error("Workflow error: %s", e)
         print(f"❌ Workflow error: {e}")
         raise
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate JIRA epics and user stories from a high-level requirement")
+    parser.add_argument("--batch-feedback", action="store_true",
+                        help="give all feedback variants up front and regenerate them in one OpenAI Batch API job")
+    BATCH_FEEDBACK = parser.parse_args().batch_feedback
+    
+    # uvloop is an optional, faster drop-in event loop; it has no Windows build
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     asyncio.run(run_workflow())
\ No newline at end of file
@@ -0,0 +1,270 @@
+import hashlib
+import sqlite3
+import inspect
+import logging
+import functools
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+import orjson
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+SIMILARITY_THRESHOLD = 0.92
+# text-embedding-3-small accepts ~8k tokens; HLRs are far shorter than this
+MAX_EMBED_CHARS = 20000
+# Keeps each embeddings request well under the per-request token limit
+EMBED_BATCH_SIZE = 256
+# Stored completions go stale as models and prompts change; the cap keeps the table from growing without bound
+COMPLETION_TTL = timedelta(days=7)
+MAX_COMPLETIONS = 2000
+# Every cached agent method embeds the same HLR, so embeddings are memoised for the life of the process
+EMBEDDING_MEMO_SIZE = 64
+
+_embedding_memo: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+# Project the current workflow runs against; entries never cross project boundaries
+_cache_scope: ContextVar[str] = ContextVar("semantic_cache_scope", default="")
+
+def set_cache_scope(project_key: Optional[str]):
+    """Scope subsequent cache lookups to a JIRA project"""
+    _cache_scope.set(project_key or "")
+
+class SemanticCache:
+    """SQLite-backed cache of LLM results, matched on HLR embedding similarity"""
+    _instance = None
+
+    def __new__(cls, db_path: str = "semantic_cache.db"):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, db_path: str = "semantic_cache.db"):
+        if hasattr(self, '_initialized'):
+            return
+        self.db_path = db_path
+        # (namespace, scope, digest) -> (row ids, normalised embedding matrix)
+        self._indexes: Dict[Tuple[str, str, str], Tuple[list, np.ndarray]] = {}
+        self._init_database()
+        self._initialized = True
+        logger.info("Semantic Cache initialized")
+
+    def _init_database(self):
+        """Initialize SQLite database with the entries table"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                namespace TEXT,
+                scope TEXT,
+                digest TEXT,
+                embedding BLOB,
+                prompt TEXT,
+                response TEXT,
+                created_at TEXT
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_key ON entries (namespace, scope, digest)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS completions (
+                digest TEXT PRIMARY KEY,
+                response TEXT,
+                created_at TEXT
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_completions_created ON completions (created_at)")
+        conn.commit()
+        conn.close()
+
+    def _index(self, key: Tuple[str, str, str]) -> Tuple[list, np.ndarray]:
+        """Load the embeddings for one (namespace, scope, digest) bucket, once per process"""
+        if key not in self._indexes:
+            conn = sqlite3.connect(self.db_path)
+            rows = conn.execute(
+                "SELECT id, embedding FROM entries WHERE namespace = ? AND scope = ? AND digest = ?", key
+            ).fetchall()
+            conn.close()
+            ids = [row[0] for row in rows]
+            matrix = np.vstack([np.frombuffer(row[1], dtype=np.float32) for row in rows]) if rows else np.empty((0, 0), dtype=np.float32)
+            self._indexes[key] = (ids, matrix)
+        return self._indexes[key]
+
+    def lookup(self, key: Tuple[str, str, str], embedding: np.ndarray) -> Optional[Any]:
+        """Return the stored response of the nearest entry if it clears the similarity threshold"""
+        ids, matrix = self._index(key)
+        if not ids:
+            return None
+
+        # Embeddings are stored unit-length, so the dot product is the cosine similarity
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] < SIMILARITY_THRESHOLD:
+            return None
+
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute("SELECT response FROM entries WHERE id = ?", (ids[best],)).fetchone()
+        conn.close()
+        logger.info("Semantic cache hit in %s (similarity %.3f)", key[0], scores[best])
+        return orjson.loads(row[0]) if row else None
+
+    def store(self, key: Tuple[str, str, str], embedding: np.ndarray, prompt: str, response: Any):
+        """Persist a new entry and add it to the in-memory index"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.execute("""
+            INSERT INTO entries (namespace, scope, digest, embedding, prompt, response, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (*key, embedding.tobytes(), prompt, orjson.dumps(response), datetime.now().isoformat()))
+        conn.commit()
+        conn.close()
+
+        ids, matrix = self._index(key)
+        ids.append(cursor.lastrowid)
+        self._indexes[key] = (ids, np.vstack([matrix, embedding]) if matrix.size else embedding[np.newaxis, :])
+
+    def get_completion(self, digest: str) -> Optional[str]:
+        """Return an unexpired stored completion for an exactly matching request digest"""
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT response FROM completions WHERE digest = ? AND created_at >= ?",
+            (digest, (datetime.now() - COMPLETION_TTL).isoformat())
+        ).fetchone()
+        conn.close()
+        return row[0] if row else None
+
+    def put_completion(self, digest: str, response: str):
+        """Persist a completion under its request digest, pruning expired rows and the oldest beyond the cap"""
+        now = datetime.now()
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO completions (digest, response, created_at) VALUES (?, ?, ?)",
+            (digest, response, now.isoformat())
+        )
+        conn.execute("""
+            DELETE FROM completions WHERE created_at < ? OR digest NOT IN (
+                SELECT digest FROM completions ORDER BY created_at DESC LIMIT ?
+            )
+        """, ((now - COMPLETION_TTL).isoformat(), MAX_COMPLETIONS))
+        conn.commit()
+        conn.close()
+
+    def clear(self, scope: Optional[str] = None):
+        """Drop every entry, or only those of one project.
+
+        Completions are keyed on the full request rather than a project, so only a full clear removes them.
+        """
+        conn = sqlite3.connect(self.db_path)
+        if scope is None:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM completions")
+        else:
+            conn.execute("DELETE FROM entries WHERE scope = ?", (scope,))
+        conn.commit()
+        conn.close()
+        if scope is None:
+            self._indexes.clear()
+        else:
+            self._indexes = {key: index for key, index in self._indexes.items() if key[1] != scope}
+
+async def embed_text(client, text: str) -> np.ndarray:
+    """Unit-length embedding of a piece of text, memoised on a digest of the text"""
+    text = text[:MAX_EMBED_CHARS]
+    key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    if key in _embedding_memo:
+        _embedding_memo.move_to_end(key)
+        return _embedding_memo[key]
+
+    response = await client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+    vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+    vector /= np.linalg.norm(vector)
+    _embedding_memo[key] = vector
+    if len(_embedding_memo) > EMBEDDING_MEMO_SIZE:
+        _embedding_memo.popitem(last=False)
+    return vector
+
+async def embed_texts(client, texts: List[str], batch_size: int = EMBED_BATCH_SIZE) -> np.ndarray:
+    """Unit-length embeddings of many texts, one API request per batch"""
+    vectors = []
+    for start in range(0, len(texts), batch_size):
+        batch = [text[:MAX_EMBED_CHARS] or " " for text in texts[start:start + batch_size]]
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=batch)
+        vectors.extend(item.embedding for item in sorted(response.data, key=lambda item: item.index))
+    matrix = np.asarray(vectors, dtype=np.float32)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+def completion_digest(model: str, system: str, prompt: str, temperature: float, max_tokens: int,
+                      response_format: Optional[Dict[str, Any]] = None) -> str:
+    """Digest of a completion request; whitespace is normalised so re-indented prompts still match"""
+    request = [model, " ".join(system.split()), " ".join(prompt.split()), temperature, max_tokens, response_format]
+    return hashlib.blake2b(orjson.dumps(request), digest_size=16).hexdigest()
+
+def _cache_key(namespace: str, exact: Any) -> Tuple[str, str, str]:
+    """Bucket key: the namespace, the current project scope and a digest of the exactly-matched inputs"""
+    digest = hashlib.sha256(orjson.dumps(exact, default=str, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return (namespace, _cache_scope.get(), digest)
+
+async def recall(client, namespace: str, text: str, exact: Any = None) -> Optional[Any]:
+    """Look up a value stored for text similar to this one, or None"""
+    try:
+        return SemanticCache().lookup(_cache_key(namespace, exact), await embed_text(client, text))
+    except Exception as e:
+        logger.error("Semantic cache lookup failed: %s", e)
+        return None
+
+async def remember(client, namespace: str, text: str, value: Any, exact: Any = None):
+    """Store a value so later calls to recall with similar text can reuse it"""
+    try:
+        SemanticCache().store(_cache_key(namespace, exact), await embed_text(client, text), text, value)
+    except Exception as e:
+        logger.error("Semantic cache store failed: %s", e)
+
+def semantic_cache(namespace: str, decode: Callable[[Any], Any] = lambda data: data,
+                   cache_if: Callable[[Any], bool] = bool, exact_hlr: bool = False,
+                   derived_from_hlr: Tuple[str, ...] = ()):
+    """Serve an agent method from the semantic cache when a near-identical HLR was seen before.
+
+    The first argument (the HLR) is matched by embedding similarity; every other argument
+    must match exactly, so feedback or new answers always reach the model. With exact_hlr
+    the HLR must match exactly too, for output that should never be reused across requirements.
+    Arguments named in derived_from_hlr are rendered from the HLR (such as JIRA guidance that
+    quotes it) and are left out of the exact match; the project they describe is the cache scope.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, hlr: str, *args, queue=None, **kwargs):
+            try:
+                cache = SemanticCache()
+                arguments = signature.bind_partial(self, hlr, *args, **kwargs).arguments
+                exact = {name: value for name, value in arguments.items()
+                         if name not in ("self", "hlr", *derived_from_hlr)}
+                key = _cache_key(namespace, [hlr, exact] if exact_hlr else exact)
+                embedding = await embed_text(self.client, hlr)
+                cached = cache.lookup(key, embedding)
+            except Exception as e:
+                logger.error("Semantic cache lookup failed: %s", e)
+                cache = None
+                cached = None
+
+            if cached is not None:
+                result = decode(cached)
+                if queue is not None:
+                    for item in result:
+                        await queue.put(item)
+                return result
+
+            if queue is not None:
+                kwargs["queue"] = queue
+            result = await func(self, hlr, *args, **kwargs)
+
+            if cache is not None and cache_if(result):
+                try:
+                    cache.store(key, embedding, hlr, result)
+                except Exception as e:
+                    logger.error("Semantic cache store failed: %s", e)
+            return result
+        return wrapper
+    return decorator